@@ -2,7 +2,8 @@
 # Save as release_mirrordna.py and run: python3 release_mirrordna.py
 # Requires: Python 3, git, GitHub CLI (gh) authenticated
 
-import hashlib, re, subprocess
+import hashlib, os, re, subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # CONFIG
@@ -11,29 +12,31 @@ TAG = "v15.1.6"   # 🔁 bump per release
 TITLE = "MirrorDNA Standard — Release v15.1.6"
 BODY_FILE = "RELEASE_NOTES.md"
 
-def sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
+CHECKSUM_LINE_RE = re.compile(r"checksum_sha256:.*")
 
 def update_frontmatter(path: Path):
-    text = path.read_text(encoding="utf-8")
-    checksum = sha256_file(path)
-    if "checksum_sha256:" in text:
-        new_text = re.sub(r"checksum_sha256:.*", f"checksum_sha256: {checksum}", text)
-    else:
+    # Read once: the raw bytes are hashed, and decoded (with read_text's
+    # newline translation) for the rewrite
+    data = path.read_bytes()
+    checksum = hashlib.sha256(data).hexdigest()
+    text = data.decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    # One pass: substitute and learn whether the field existed at the same time
+    new_text, found = CHECKSUM_LINE_RE.subn(f"checksum_sha256: {checksum}", text)
+    if not found:
         new_text = text.replace("---\n", f"---\nchecksum_sha256: {checksum}\n", 1)
     path.write_text(new_text, encoding="utf-8")
     return checksum
 
 print("⟡⟦STEP 1⟧ Updating checksums…")
 checksums = {}
-for md in Path(".").rglob("*.md"):
-    checksum = update_frontmatter(md)
-    checksums[md] = checksum
-    print(f"✓ {md} → {checksum}")
+md_files = list(Path(".").rglob("*.md"))
+# Files are independent and hashlib drops the GIL while hashing, so threads overlap I/O and hashing
+with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4)) as pool:
+    for md, checksum in zip(md_files, pool.map(update_frontmatter, md_files)):
+        checksums[md] = checksum
+        print(f"✓ {md} → {checksum}")
 
 print("\n⟡⟦STEP 2⟧ Verifying with repo script…")
 subprocess.run(["./tools/checksums/verify_repo_checksums.sh"], check=True)
@@ -12,14 +12,23 @@ Usage:
 
   # Verify only (non-zero exit if mismatch)
   python scripts/generate_checksum.py --verify examples/*.json
+
+  # Verify, skipping sidecars unchanged (same mtime and size) since they last passed
+  python scripts/generate_checksum.py --verify --cache .checksum-cache.json examples/*.json
 """
 import argparse
 import hashlib
 import json
+import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 
 REQUIRED_KEYS = ["vault_id", "glyphsig", "version", "checksum_sha256"]
+PARALLEL_MIN_FILES = 64  # below this, process start-up costs more than it saves
+CHECKSUM_FIELD_RE = re.compile(rb'("checksum_sha256"\s*:\s*")[^"\\]*"')
 
 def compute_checksum(obj: dict) -> str:
     """Compute sha256 of JSON with `checksum_sha256` blanked out, sorted keys."""
@@ -29,56 +38,147 @@ def compute_checksum(obj: dict) -> str:
     blob = json.dumps(data, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
     return hashlib.sha256(blob).hexdigest()
 
+def parse_json(raw: bytes) -> dict:
+    # Always the stdlib parser: the checksum covers the parsed values, and faster
+    # parsers differ on big ints (-> float) and NaN/Infinity, so sums would not match
+    return json.loads(raw.decode("utf-8"))
+
 def load_json(path: Path) -> dict:
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return parse_json(path.read_bytes())
+
+def atomic_write(path: Path, data: bytes, current: Optional[bytes] = None) -> bool:
+    """Replace `path` with `data` via a temp file + os.replace; no-op if content is unchanged.
+
+    `current` is the file's existing content when the caller already has it in hand.
+    Returns True if the file was written.
+    """
+    if current is None:
+        try:
+            current = path.read_bytes()
+        except FileNotFoundError:
+            pass
+    if current == data:
+        return False
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return True
+
+def has_nested_key(value, key: str) -> bool:
+    """True if `key` appears in any object nested inside `value` (lists included)."""
+    stack = list(value.values()) if isinstance(value, dict) else [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            if key in item:
+                return True
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+    return False
 
 def save_json(path: Path, obj: dict) -> None:
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(obj, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+    atomic_write(path, (json.dumps(obj, indent=2, ensure_ascii=False) + "\n").encode("utf-8"))
+
+def load_cache(path: Path) -> Dict[str, dict]:
+    """Load the verify cache: {sidecar path: {"mtime_ns", "size", "sha256"}}."""
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def save_cache(path: Path, cache: Dict[str, dict]) -> None:
+    atomic_write(path, json.dumps(cache, sort_keys=True).encode("utf-8"))
 
-def verify(path: Path) -> bool:
+def verify(path: Path) -> Tuple[bool, str, str]:
+    """Check one sidecar; returns (ok, sha256, message) so it can run in a worker process."""
     obj = load_json(path)
     missing = [k for k in REQUIRED_KEYS if k not in obj]
     if missing:
-        print(f"::error file={path}::Missing required keys: {missing}")
-        return False
+        return False, "", f"::error file={path}::Missing required keys: {missing}"
     expected = compute_checksum(obj)
     ok = (obj.get("checksum_sha256", "") == expected)
     if not ok:
-        print(f"::error file={path}::Checksum mismatch. expected={expected} actual={obj.get('checksum_sha256','')}")
-    else:
-        print(f"OK  {path}  sha256={expected}")
-    return ok
+        return False, expected, f"::error file={path}::Checksum mismatch. expected={expected} actual={obj.get('checksum_sha256','')}"
+    return True, expected, f"OK  {path}  sha256={expected}"
 
-def write(path: Path) -> bool:
-    obj = load_json(path)
+def write(path: Path) -> Tuple[bool, str, str]:
+    """Rewrite one sidecar's checksum; returns (ok, sha256, message) like verify()."""
+    raw = path.read_bytes()
+    obj = parse_json(raw)
     missing = [k for k in REQUIRED_KEYS if k not in obj]
     if missing:
-        print(f"::error file={path}::Missing required keys: {missing}")
-        return False
+        return False, "", f"::error file={path}::Missing required keys: {missing}"
     new_sum = compute_checksum(obj)
-    obj["checksum_sha256"] = new_sum
-    save_json(path, obj)
-    print(f"WROTE  {path}  sha256={new_sum}")
-    return True
+    # Patch the value in place when the top-level field is a string and no nested
+    # object has the key, so the single match must be the top-level field: keeps
+    # the file's own formatting and skips re-serialising it.
+    n = 0
+    if isinstance(obj["checksum_sha256"], str) and not has_nested_key(obj, "checksum_sha256"):
+        patched, n = CHECKSUM_FIELD_RE.subn(rb"\g<1>" + new_sum.encode("ascii") + b'"', raw)
+    if n == 1:
+        atomic_write(path, patched, current=raw)
+    else:
+        obj["checksum_sha256"] = new_sum
+        save_json(path, obj)
+    return True, new_sum, f"WROTE  {path}  sha256={new_sum}"
 
 def main():
     ap = argparse.ArgumentParser(description="MirrorDNA checksum helper")
     ap.add_argument("files", nargs="+", help="JSON sidecars to process (supports shell globs)")
     ap.add_argument("--verify", action="store_true", help="Verify only; do not write changes")
+    ap.add_argument("--cache", type=Path, metavar="FILE",
+                    help="With --verify, skip sidecars whose mtime and size match their last passing run")
     args = ap.parse_args()
 
-    ok_all = True
-    for pattern in args.files:
-        for path in sorted(Path().glob(pattern)):
-            if not path.is_file():
-                continue
-            if args.verify:
-                ok_all = verify(path) and ok_all
+    # Overlapping patterns (e.g. `*.json` and `m*.json`) must not process a sidecar twice;
+    # dict.fromkeys dedupes while keeping first-seen order.
+    matches = dict.fromkeys(path for pattern in args.files for path in sorted(Path().glob(pattern)))
+    paths = [path for path in matches if path.is_file()]
+    worker = verify if args.verify else write
+    results = [None] * len(paths)
+    pending = list(range(len(paths)))
+
+    # A sidecar whose (mtime_ns, size) matches its last passing verify is not re-read
+    cache = load_cache(args.cache) if args.verify and args.cache else None
+    if cache is not None:
+        stats = [path.stat() for path in paths]
+        pending = []
+        for i, path in enumerate(paths):
+            entry = cache.get(str(path))
+            st = stats[i]
+            sha = entry.get("sha256") if isinstance(entry, dict) else None
+            if sha and entry.get("mtime_ns") == st.st_mtime_ns and entry.get("size") == st.st_size:
+                results[i] = (True, sha, f"OK  {path}  sha256={sha}")
             else:
-                ok_all = write(path) and ok_all
+                pending.append(i)
+
+    # Each sidecar is independent, so large batches fan out across processes;
+    # map() keeps results in input order.
+    todo = [paths[i] for i in pending]
+    if len(todo) >= PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor() as pool:
+            computed = list(pool.map(worker, todo, chunksize=8))
+    else:
+        computed = map(worker, todo)
+    for i, result in zip(pending, computed):
+        results[i] = result
+
+    if cache is not None:
+        for i in pending:
+            ok, checksum, _ = results[i]
+            if ok:
+                st = stats[i]
+                cache[str(paths[i])] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha256": checksum}
+            else:
+                cache.pop(str(paths[i]), None)
+        save_cache(args.cache, cache)
+
+    # One write for the whole report instead of a print() (and stdout lock) per sidecar
+    sys.stdout.write("".join(f"{message}\n" for _, _, message in results))
+    ok_all = all(ok for ok, _, _ in results)
     sys.exit(0 if ok_all else 1)
 
 if __name__ == "__main__":
@@ -0,0 +1,167 @@
+"""
+Tests for scripts/generate_checksum.py.
+"""
+
+import json
+import sys
+
+import pytest
+
+from scripts import generate_checksum
+
+
+SIDECAR = {
+    'vault_id': 'AMOS://Test/Sidecar/v1.0',
+    'glyphsig': '⟡⟦TEST⟧',
+    'version': '1.0',
+    'checksum_sha256': '',
+}
+
+
+def write_sidecar(path, obj):
+    """Write a sidecar the way a user would (indent 2, UTF-8)."""
+    path.write_text(json.dumps(obj, indent=2, ensure_ascii=False) + '\n', encoding='utf-8')
+    return path
+
+
+def run_main(monkeypatch, *args):
+    """Run the CLI in-process; returns its exit code.
+
+    File arguments are glob patterns relative to the working directory, so
+    callers chdir into tmp_path and pass plain names.
+    """
+    monkeypatch.setattr(sys, 'argv', ['generate_checksum.py', *map(str, args)])
+    with pytest.raises(SystemExit) as exc:
+        generate_checksum.main()
+    return exc.value.code
+
+
+class TestParsing:
+    """The checksum must not depend on which JSON parser is installed."""
+
+    def test_big_int_checksum_matches_stdlib(self):
+        raw = b'{"n": 123456789012345678901234567890, "checksum_sha256": ""}'
+        assert generate_checksum.compute_checksum(generate_checksum.parse_json(raw)) == \
+            generate_checksum.compute_checksum(json.loads(raw))
+
+    def test_non_finite_floats_accepted(self):
+        obj = generate_checksum.parse_json(b'{"a": NaN, "b": Infinity}')
+        assert obj['a'] != obj['a']
+        assert obj['b'] == float('inf')
+
+    def test_write_then_verify_big_int(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        path = tmp_path / 'big.sidecar.json'
+        path.write_text(
+            '{"vault_id": "v", "glyphsig": "g", "version": "1", "checksum_sha256": null,\n'
+            ' "n": 123456789012345678901234567890}\n',
+            encoding='utf-8'
+        )
+        assert run_main(monkeypatch, path.name) == 0
+        assert '123456789012345678901234567890' in path.read_text(encoding='utf-8')
+        assert run_main(monkeypatch, '--verify', path.name) == 0
+
+
+class TestWrite:
+    """Writing the checksum back into a sidecar."""
+
+    def test_patch_keeps_formatting(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        path = tmp_path / 'a.sidecar.json'
+        path.write_text(
+            '{"vault_id":"v","glyphsig":"g","version":"1","checksum_sha256":"old"}\n',
+            encoding='utf-8'
+        )
+        assert run_main(monkeypatch, path.name) == 0
+        text = path.read_text(encoding='utf-8')
+        assert text.startswith('{"vault_id":"v",')
+        assert json.loads(text)['checksum_sha256'] == generate_checksum.compute_checksum(json.loads(text))
+
+    def test_nested_key_with_null_top_level(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        path = write_sidecar(
+            tmp_path / 'a.sidecar.json',
+            dict(SIDECAR, checksum_sha256=None, meta={'checksum_sha256': 'old'})
+        )
+        assert run_main(monkeypatch, path.name) == 0
+        obj = json.loads(path.read_text(encoding='utf-8'))
+        assert obj['meta'] == {'checksum_sha256': 'old'}
+        assert obj['checksum_sha256'] == generate_checksum.compute_checksum(obj)
+        assert run_main(monkeypatch, '--verify', path.name) == 0
+
+    def test_nested_key_in_list(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        path = write_sidecar(
+            tmp_path / 'a.sidecar.json',
+            dict(SIDECAR, history=[{'checksum_sha256': 'old'}])
+        )
+        assert run_main(monkeypatch, path.name) == 0
+        obj = json.loads(path.read_text(encoding='utf-8'))
+        assert obj['history'] == [{'checksum_sha256': 'old'}]
+        assert run_main(monkeypatch, '--verify', path.name) == 0
+
+    def test_has_nested_key(self):
+        assert not generate_checksum.has_nested_key({'checksum_sha256': ''}, 'checksum_sha256')
+        assert generate_checksum.has_nested_key({'a': [1, {'checksum_sha256': None}]}, 'checksum_sha256')
+
+
+class TestVerifyCache:
+    """--verify --cache skips sidecars unchanged since they last passed."""
+
+    def make_valid(self, path):
+        obj = dict(SIDECAR)
+        obj['checksum_sha256'] = generate_checksum.compute_checksum(obj)
+        return write_sidecar(path, obj)
+
+    def test_hit_skips_verify(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        path = self.make_valid(tmp_path / 'a.sidecar.json')
+        assert run_main(monkeypatch, '--verify', '--cache', 'cache.json', path.name) == 0
+        cache = json.loads((tmp_path / 'cache.json').read_text(encoding='utf-8'))
+        assert cache[path.name]['size'] == path.stat().st_size
+
+        calls = []
+        monkeypatch.setattr(generate_checksum, 'verify', lambda p: calls.append(p))
+        assert run_main(monkeypatch, '--verify', '--cache', 'cache.json', path.name) == 0
+        assert calls == []
+
+    def test_changed_file_is_a_miss(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        path = self.make_valid(tmp_path / 'a.sidecar.json')
+        assert run_main(monkeypatch, '--verify', '--cache', 'cache.json', path.name) == 0
+
+        obj = json.loads(path.read_text(encoding='utf-8'))
+        obj['version'] = '2.0'
+        write_sidecar(path, obj)
+        assert run_main(monkeypatch, '--verify', '--cache', 'cache.json', path.name) == 1
+
+    def test_failure_evicts_entry(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        path = write_sidecar(tmp_path / 'a.sidecar.json', dict(SIDECAR, checksum_sha256='bad'))
+        st = path.stat()
+        (tmp_path / 'cache.json').write_text(json.dumps({
+            'stale.sidecar.json': {'mtime_ns': 1, 'size': 1, 'sha256': 'x'},
+            path.name: {'mtime_ns': st.st_mtime_ns - 1, 'size': st.st_size, 'sha256': 'x'},
+        }), encoding='utf-8')
+        assert run_main(monkeypatch, '--verify', '--cache', 'cache.json', path.name) == 1
+        cache = json.loads((tmp_path / 'cache.json').read_text(encoding='utf-8'))
+        assert path.name not in cache
+        assert 'stale.sidecar.json' in cache
+
+    def test_entry_without_sha256_is_a_miss(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        path = self.make_valid(tmp_path / 'a.sidecar.json')
+        st = path.stat()
+        (tmp_path / 'cache.json').write_text(json.dumps({
+            path.name: {'mtime_ns': st.st_mtime_ns, 'size': st.st_size},
+        }), encoding='utf-8')
+        assert run_main(monkeypatch, '--verify', '--cache', 'cache.json', path.name) == 0
+        cache = json.loads((tmp_path / 'cache.json').read_text(encoding='utf-8'))
+        assert cache[path.name]['sha256'] == json.loads(path.read_text(encoding='utf-8'))['checksum_sha256']
+
+    def test_unreadable_cache_starts_empty(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        path = self.make_valid(tmp_path / 'a.sidecar.json')
+        (tmp_path / 'cache.json').write_text('not json', encoding='utf-8')
+        assert run_main(monkeypatch, '--verify', '--cache', 'cache.json', path.name) == 0
+        assert path.name in json.loads((tmp_path / 'cache.json').read_text(encoding='utf-8'))
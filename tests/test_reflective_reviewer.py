@@ -0,0 +1,133 @@
+"""
+Tests for tools/reflective_reviewer.py.
+"""
+
+from collections import OrderedDict
+
+import pytest
+
+from tools import reflective_reviewer
+from tools.reflective_reviewer import ReflectiveReviewer, audit_codebase
+
+
+# 60 lines of 10 characters: 600 characters with LF endings, 660 with CRLF
+SOURCE = 'x = 12345\n' * 60
+
+
+def messages(report):
+    return [finding['message'] for finding in report['findings']]
+
+
+class TestReadSource:
+    """Files are audited as Path.read_text would read them."""
+
+    def test_crlf_matches_lf(self, tmp_path):
+        lf = tmp_path / 'lf.py'
+        lf.write_bytes(SOURCE.encode('ascii'))
+        crlf = tmp_path / 'crlf.py'
+        crlf.write_bytes(SOURCE.replace('\n', '\r\n').encode('ascii'))
+
+        expected = messages(ReflectiveReviewer().audit_file(lf))
+        assert "Cite-or-Silence (AHP) not implemented" not in expected
+        assert messages(ReflectiveReviewer().audit_file(crlf)) == expected
+
+    def test_undecodable_file_raises(self, tmp_path):
+        path = tmp_path / 'latin1.py'
+        path.write_bytes('name = "café"\n'.encode('latin-1'))
+
+        with pytest.raises(UnicodeDecodeError):
+            ReflectiveReviewer().audit_file(path)
+
+    def test_undecodable_file_not_audited(self, tmp_path, capsys):
+        (tmp_path / 'good.py').write_text('x = 1\n', encoding='utf-8')
+        (tmp_path / 'latin1.py').write_bytes('name = "café"\n'.encode('latin-1'))
+
+        report = audit_codebase(tmp_path, extensions=['.py'])
+
+        assert report['files_audited'] == 1
+        assert [r['file_path'] for r in report['file_reports']] == [str(tmp_path / 'good.py')]
+        assert 'Error auditing' in capsys.readouterr().out
+
+
+class TestReportCache:
+    """cache_dir reuses a file's report until its content changes."""
+
+    def test_hit_then_miss_after_edit(self, tmp_path, monkeypatch):
+        path = tmp_path / 'module.py'
+        path.write_text(SOURCE, encoding='utf-8')
+        cache_dir = tmp_path / 'cache'
+        first = ReflectiveReviewer(cache_dir=cache_dir).audit_file(path)
+        assert len(list(cache_dir.glob('*.json'))) == 1
+
+        audited = []
+        original = ReflectiveReviewer.audit_implementation
+
+        def audit_implementation(self, code, context=None):
+            audited.append(code)
+            return original(self, code, context)
+
+        monkeypatch.setattr(ReflectiveReviewer, 'audit_implementation', audit_implementation)
+        reviewer = ReflectiveReviewer(cache_dir=cache_dir)
+        assert reviewer.audit_file(path) == first
+        assert [f.to_dict() for f in reviewer.findings] == first['findings']
+        assert audited == []
+
+        path.write_text('x = 1\n', encoding='utf-8')
+        second = ReflectiveReviewer(cache_dir=cache_dir).audit_file(path)
+        assert len(audited) == 1
+        assert second['findings'] == []
+        assert len(list(cache_dir.glob('*.json'))) == 2
+
+
+class TestFindingsMemo:
+    """audit_implementation memoizes findings by content and file kind."""
+
+    def test_memo_hit_and_miss(self, monkeypatch):
+        scanned = []
+        original = reflective_reviewer._scan_features
+
+        def scan_features(code):
+            scanned.append(code)
+            return original(code)
+
+        monkeypatch.setattr(reflective_reviewer, '_FINDINGS_MEMO', OrderedDict())
+        monkeypatch.setattr(reflective_reviewer, '_scan_features', scan_features)
+        reviewer = ReflectiveReviewer()
+
+        first = reviewer.audit_implementation(SOURCE)
+        assert reviewer.audit_implementation(SOURCE) == first
+        assert reviewer.audit_implementation(SOURCE.encode('ascii')) == first
+        assert len(scanned) == 1
+
+        edited = SOURCE + 'session_id = vault_id\n'
+        assert reviewer.audit_implementation(edited) != first
+        assert len(scanned) == 2
+
+        standard = reviewer.audit_implementation(SOURCE, {'is_standard_file': True})
+        assert len(scanned) == 3
+        assert len(standard) == len(first) + 1
+
+    def test_memo_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(reflective_reviewer, '_FINDINGS_MEMO', OrderedDict())
+        monkeypatch.setattr(reflective_reviewer, 'FINDINGS_MEMO_SIZE', 2)
+        reviewer = ReflectiveReviewer()
+        for i in range(5):
+            reviewer.audit_implementation(f'x = {i}\n')
+        assert len(reflective_reviewer._FINDINGS_MEMO) == 2
+
+
+class TestCollectFiles:
+    """_collect_files walks the tree in sorted order."""
+
+    def test_unstatable_entry_skipped_alone(self, tmp_path, capsys):
+        (tmp_path / 'a.py').write_text('a = 1\n', encoding='utf-8')
+        # A self-referencing symlink: stat() fails with ELOOP
+        (tmp_path / 'b.py').symlink_to(tmp_path / 'b.py')
+        (tmp_path / 'c.py').write_text('c = 1\n', encoding='utf-8')
+        (tmp_path / 'sub').mkdir()
+        (tmp_path / 'sub' / 'd.py').write_text('d = 1\n', encoding='utf-8')
+
+        files = reflective_reviewer._collect_files(tmp_path, ['.py'])
+
+        assert [path.name for path, _ in files] == ['a.py', 'c.py', 'd.py']
+        assert 'b.py' in capsys.readouterr().out
@@ -0,0 +1,113 @@
+"""
+Tests for tools/truth_state.py.
+"""
+
+import json
+
+import pytest
+
+from tools import truth_state
+from tools.truth_state import TruthState, TruthStateEnforcer
+
+
+def write_vault(root, count, body='lorem ipsum dolor sit amet\n'):
+    """Write count markdown files, each declaring its own VaultID."""
+    root.mkdir(exist_ok=True)
+    for i in range(count):
+        (root / f'note{i:03d}.md').write_text(
+            f'VaultID: AMOS://Test/Note{i}/v1.0\n\n{body}', encoding='utf-8'
+        )
+    return root
+
+
+@pytest.fixture
+def count_reads(monkeypatch):
+    """Count read_bytes calls per path made after the fixture is requested."""
+    reads = {}
+    original = truth_state.Path.read_bytes
+
+    def read_bytes(path):
+        reads[path.name] = reads.get(path.name, 0) + 1
+        return original(path)
+
+    monkeypatch.setattr(truth_state.Path, 'read_bytes', read_bytes)
+    return reads
+
+
+class TestVaultContent:
+    """Vault file contents are read on first query and then kept."""
+
+    def test_large_vault_files_read_once(self, tmp_path, count_reads):
+        vault = write_vault(tmp_path / 'vault', 100)
+        enforcer = TruthStateEnforcer(vault_path=vault)
+        count_reads.clear()
+
+        statements = [{'text': f'Checksum: {i:064x}'} for i in range(20)]
+        report = enforcer.generate_feu_report(statements)
+
+        assert report['hallucinations'] == 20
+        assert len(count_reads) == 100
+        assert set(count_reads.values()) == {1}
+
+    def test_vault_wide_search_finds_last_file(self, tmp_path):
+        vault = write_vault(tmp_path / 'vault', 100)
+        (vault / 'note099.md').write_text(
+            'VaultID: AMOS://Test/Note99/v1.0\n\n⟡⟦KNOWN⟧\n', encoding='utf-8'
+        )
+        enforcer = TruthStateEnforcer(vault_path=vault)
+
+        assert enforcer.detect_hallucination('Signed ⟡⟦KNOWN⟧') == (False, None)
+        assert enforcer.detect_hallucination('Signed ⟡⟦OTHER⟧')[0]
+
+    def test_vault_id_lookup_is_case_insensitive(self, tmp_path):
+        vault = write_vault(tmp_path / 'vault', 3, body='The Vault Is Primary.\n')
+        enforcer = TruthStateEnforcer(vault_path=vault)
+
+        assert enforcer.classify_statement(
+            'the vault is primary', vault_id='AMOS://Test/Note1/v1.0'
+        ) is TruthState.FACT
+        assert enforcer.enforce_vault_primacy(
+            'the vault is secondary', 'AMOS://Test/Note1/v1.0'
+        )[0] is False
+
+
+class TestIndexCache:
+    """index_cache reuses a file's entry until its mtime or size changes."""
+
+    def test_unchanged_files_not_read(self, tmp_path, count_reads):
+        vault = write_vault(tmp_path / 'vault', 3)
+        cache = tmp_path / 'index.json'
+        first = TruthStateEnforcer(vault_path=vault, index_cache=cache)
+        assert cache.exists()
+
+        count_reads.clear()
+        second = TruthStateEnforcer(vault_path=vault, index_cache=cache)
+        assert count_reads == {}
+        assert {k: v['checksum'] for k, v in second.vault_index.items()} == \
+            {k: v['checksum'] for k, v in first.vault_index.items()}
+
+    def test_edited_file_is_a_miss(self, tmp_path, count_reads):
+        vault = write_vault(tmp_path / 'vault', 3)
+        cache = tmp_path / 'index.json'
+        TruthStateEnforcer(vault_path=vault, index_cache=cache)
+
+        (vault / 'note001.md').write_text(
+            'VaultID: AMOS://Test/Renamed/v2.0\n\nchanged\n', encoding='utf-8'
+        )
+        count_reads.clear()
+        enforcer = TruthStateEnforcer(vault_path=vault, index_cache=cache)
+
+        assert count_reads == {'note001.md': 1}
+        assert 'AMOS://Test/Renamed/v2.0' in enforcer.vault_index
+        assert 'AMOS://Test/Note1/v1.0' not in enforcer.vault_index
+
+    def test_removed_file_dropped_from_cache(self, tmp_path):
+        vault = write_vault(tmp_path / 'vault', 3)
+        cache = tmp_path / 'index.json'
+        TruthStateEnforcer(vault_path=vault, index_cache=cache)
+
+        (vault / 'note002.md').unlink()
+        enforcer = TruthStateEnforcer(vault_path=vault, index_cache=cache)
+
+        assert 'AMOS://Test/Note2/v1.0' not in enforcer.vault_index
+        assert str(vault / 'note002.md') not in json.loads(cache.read_text(encoding='utf-8'))
@@ -0,0 +1,221 @@
+"""
+Tests for tools/vault_manager.py.
+"""
+
+import json
+import math
+
+import pytest
+
+from tools.vault_manager import VaultManager
+
+
+def write_artifact(path, text='artifact body\n'):
+    path.write_text(text, encoding='utf-8')
+    return path
+
+
+class TestPersistence:
+    """Saved manifests and lineage graphs match the stdlib json encoding."""
+
+    def test_non_finite_metadata_round_trips(self, tmp_path):
+        vault = tmp_path / 'vault'
+        manager = VaultManager(vault)
+        manager.register_artifact(
+            'AMOS://Test/A/v1.0',
+            write_artifact(tmp_path / 'a.md'),
+            metadata={'score': float('nan'), 'limit': float('inf'), 'big': 1e16}
+        )
+        state_hash = manager.compute_vault_state_hash()
+
+        text = (vault / 'vault_manifest.json').read_text(encoding='utf-8')
+        assert text == json.dumps(manager.manifest, indent=2, ensure_ascii=False) + '\n'
+
+        metadata = VaultManager(vault).manifest['artifacts']['AMOS://Test/A/v1.0']['metadata']
+        assert math.isnan(metadata['score'])
+        assert metadata['limit'] == float('inf')
+        assert VaultManager(vault).compute_vault_state_hash() == state_hash
+
+
+def register_chain(manager, artifact, links):
+    """Register (vault_id, predecessor) pairs in order, all for one file."""
+    for vault_id, predecessor in links:
+        manager.register_artifact(vault_id, artifact, predecessor=predecessor)
+    return manager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return VaultManager(tmp_path / 'vault')
+
+
+@pytest.fixture
+def artifact(tmp_path):
+    return write_artifact(tmp_path / 'artifact.md')
+
+
+class TestDetectCycles:
+    """detect_cycles reports each predecessor cycle once."""
+
+    def test_two_node_cycle(self, manager, artifact):
+        register_chain(manager, artifact, [('A', 'B'), ('B', 'A')])
+        assert manager.detect_cycles() == [['A', 'B']]
+
+    def test_self_loop(self, manager, artifact):
+        register_chain(manager, artifact, [('S', 'S')])
+        assert manager.detect_cycles() == [['S']]
+
+    def test_acyclic_chain(self, manager, artifact):
+        register_chain(manager, artifact, [('R', None), ('C1', 'R'), ('C2', 'C1')])
+        assert manager.detect_cycles() == []
+
+    def test_cycle_behind_a_tail(self, manager, artifact):
+        register_chain(manager, artifact, [('T', 'A'), ('A', 'B'), ('B', 'A')])
+        assert manager.detect_cycles() == [['A', 'B']]
+
+    def test_result_refreshed_after_registration(self, manager, artifact):
+        register_chain(manager, artifact, [('A', 'B')])
+        assert manager.detect_cycles() == []
+        register_chain(manager, artifact, [('B', 'A')])
+        assert manager.detect_cycles() == [['A', 'B']]
+
+    def test_long_chain_does_not_recurse(self, manager, artifact):
+        for i in range(5000):
+            manager._record_artifact(f'N{i}', artifact, 'x', f'N{i - 1}' if i else None, None, True)
+        manager._record_artifact('N0', artifact, 'x', 'N4999', None, True)
+        cycles = manager.detect_cycles()
+        assert len(cycles) == 1
+        assert sorted(cycles[0]) == sorted(f'N{i}' for i in range(5000))
+
+
+class TestTraceLineage:
+    """trace_lineage follows predecessor/successor links and stops at cycles."""
+
+    def test_acyclic_chain(self, manager, artifact):
+        register_chain(manager, artifact, [('R', None), ('C1', 'R'), ('C2', 'C1')])
+        assert manager.trace_lineage('C2') == ['C2', 'C1', 'R']
+        assert manager.trace_lineage('R', 'forward') == ['R', 'C1', 'C2']
+        # Served from the chain cache the second time
+        assert manager.trace_lineage('C2') == ['C2', 'C1', 'R']
+
+    def test_two_node_cycle_terminates(self, manager, artifact):
+        register_chain(manager, artifact, [('A', 'B'), ('B', 'A')])
+        assert manager.trace_lineage('A') == ['A', 'B']
+        assert manager.trace_lineage('B') == ['B', 'A']
+        assert manager.trace_lineage('A', 'forward') == ['A', 'B']
+
+    def test_self_loop_terminates(self, manager, artifact):
+        register_chain(manager, artifact, [('S', 'S')])
+        assert manager.trace_lineage('S') == ['S']
+        assert manager.trace_lineage('S', 'forward') == ['S']
+
+    def test_cycle_behind_a_tail_terminates(self, manager, artifact):
+        register_chain(manager, artifact, [('T', 'A'), ('A', 'B'), ('B', 'A')])
+        assert manager.trace_lineage('T') == ['T', 'A', 'B']
+        valid, issues = manager.validate_lineage_chain('T')
+        assert not valid
+        assert issues
+
+
+class TestRegisterArtifacts:
+    """Batch registration records every item and saves once."""
+
+    def test_batch_round_trip(self, tmp_path, manager, artifact, monkeypatch):
+        other = write_artifact(tmp_path / 'other.md', 'other body\n')
+        saves = []
+        save_manifest = manager._save_manifest
+        monkeypatch.setattr(manager, '_save_manifest', lambda: saves.append(1) or save_manifest())
+
+        checksums = manager.register_artifacts([
+            ('R', artifact, None, {'kind': 'root'}),
+            ('C', other, 'R', None),
+        ])
+
+        assert saves == [1]
+        assert checksums == {
+            'R': manager.compute_file_checksum(artifact),
+            'C': manager.compute_file_checksum(other),
+        }
+        assert manager.trace_lineage('R', 'forward') == ['R', 'C']
+
+        reloaded = VaultManager(manager.vault_path)
+        assert reloaded.manifest['checksums'] == checksums
+        assert reloaded.manifest['artifacts']['R']['metadata'] == {'kind': 'root'}
+        assert reloaded.trace_lineage('C') == ['C', 'R']
+        assert reloaded.generate_lineage_report() == manager.generate_lineage_report()
+        assert reloaded.verify_artifact('C') == (True, [])
+
+    def test_failed_item_keeps_earlier_ones(self, tmp_path, manager, artifact):
+        with pytest.raises(FileNotFoundError):
+            manager.register_artifacts([
+                ('R', artifact, None, None),
+                ('missing', tmp_path / 'missing.md', 'R', None),
+            ])
+
+        reloaded = VaultManager(manager.vault_path)
+        assert list(reloaded.manifest['artifacts']) == ['R']
+        assert list(reloaded.lineage_graph) == ['R']
+
+
+class TestDeferredSaves:
+    """autosave=False keeps registrations in memory until flush()."""
+
+    def test_flush_persists(self, manager, artifact):
+        manager.register_artifact('R', artifact, autosave=False)
+        manager.register_artifact('C', artifact, predecessor='R', autosave=False)
+        assert not manager.manifest_path.exists()
+        assert not manager.lineage_path.exists()
+
+        manager.flush()
+
+        reloaded = VaultManager(manager.vault_path)
+        assert list(reloaded.manifest['artifacts']) == ['R', 'C']
+        assert reloaded.trace_lineage('R', 'forward') == ['R', 'C']
+        assert not list(manager.vault_path.glob('*.tmp'))
+
+    def test_flush_without_changes_does_not_write(self, manager, artifact, monkeypatch):
+        manager.register_artifact('R', artifact)
+        monkeypatch.setattr(manager, '_save_manifest', lambda: pytest.fail('unexpected save'))
+        manager.flush()
+
+    def test_autosave_writes_each_registration(self, manager, artifact):
+        manager.register_artifact('R', artifact)
+        assert list(VaultManager(manager.vault_path).manifest['artifacts']) == ['R']
+
+
+class TestChecksumCache:
+    """checksum_cache reuses a digest until the file's mtime or size changes."""
+
+    def test_hit_then_miss_after_edit(self, tmp_path, artifact, monkeypatch):
+        cache = tmp_path / 'checksums.json'
+        manager = VaultManager(tmp_path / 'vault', checksum_cache=cache)
+        checksum = manager.register_artifact('A', artifact)
+        assert cache.exists()
+
+        hashed = []
+        reloaded = VaultManager(tmp_path / 'vault', checksum_cache=cache)
+        original = reloaded._hash_file
+        monkeypatch.setattr(
+            reloaded, '_hash_file',
+            lambda path, canonicalize: hashed.append(path) or original(path, canonicalize)
+        )
+        assert reloaded.verify_artifact('A') == (True, [])
+        assert hashed == []
+
+        write_artifact(artifact, 'edited artifact body\n')
+        valid, issues = reloaded.verify_artifact('A')
+        assert hashed == [artifact]
+        assert not valid
+        assert checksum in issues[0]
+
+    def test_raw_and_canonical_cached_separately(self, tmp_path):
+        cache = tmp_path / 'checksums.json'
+        path = write_artifact(tmp_path / 'crlf.md', 'line  \r\n')
+        manager = VaultManager(tmp_path / 'vault', checksum_cache=cache)
+
+        canonical = manager.compute_file_checksum(path)
+        raw = manager.compute_file_checksum(path, canonicalize=False)
+
+        assert canonical != raw
+        assert manager.compute_file_checksum(path) == canonical
+        assert manager.compute_file_checksum(path, canonicalize=False) == raw
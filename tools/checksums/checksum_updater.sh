@@ -18,18 +18,25 @@ if [ ! -f "$FILE" ]; then
     exit 1
 fi
 
-# Check if file has a checksum line
-if ! grep -q "^checksum_sha256:" "$FILE"; then
+# Check if file has a checksum line (kept for the up-to-date check below)
+CHECKSUM_LINES=$(grep "^checksum_sha256:" "$FILE" || true)
+if [ -z "$CHECKSUM_LINES" ]; then
     echo "Error: File does not contain 'checksum_sha256:' field"
     exit 1
 fi
 
-# Create temp file without checksum line
-TEMP_FILE=$(mktemp)
-grep -v "^checksum_sha256:" "$FILE" > "$TEMP_FILE"
+# Calculate new checksum over the file without its checksum line,
+# streamed straight into shasum instead of via a temp copy
+NEW_CHECKSUM=$(grep -v "^checksum_sha256:" "$FILE" | shasum -a 256 | awk '{print $1}')
 
-# Calculate new checksum
-NEW_CHECKSUM=$(shasum -a 256 "$TEMP_FILE" | awk '{print $1}')
+# Nothing to do when the declared checksum is already current: skip the rewrite
+# (and the backup) so unchanged files keep their contents and mtime untouched
+if ! printf '%s\n' "$CHECKSUM_LINES" | grep -qvx "checksum_sha256: $NEW_CHECKSUM"; then
+    echo "✓ Checksum already up to date"
+    echo "  File: $FILE"
+    echo "  Checksum: $NEW_CHECKSUM"
+    exit 0
+fi
 
 # Update the file with new checksum
 sed -i.bak "s/^checksum_sha256:.*/checksum_sha256: $NEW_CHECKSUM/" "$FILE"
@@ -40,10 +47,8 @@ if grep -q "checksum_sha256: $NEW_CHECKSUM" "$FILE"; then
     echo "  File: $FILE"
     echo "  New checksum: $NEW_CHECKSUM"
     rm "$FILE.bak"
-    rm "$TEMP_FILE"
 else
     echo "✗ Checksum update failed"
     mv "$FILE.bak" "$FILE"
-    rm "$TEMP_FILE"
     exit 1
 fi
@@ -19,24 +19,18 @@ if [ ! -f "$FILE" ]; then
     exit 1
 fi
 
-# Check if file has a checksum line
-if ! grep -q "^checksum_sha256:" "$FILE"; then
+# Read the checksum line once; it serves both the presence check and extraction
+CHECKSUM_LINES=$(grep "^checksum_sha256:" "$FILE" || true)
+if [ -z "$CHECKSUM_LINES" ]; then
     echo "⚠ Warning: File does not contain 'checksum_sha256:' field"
     exit 0
 fi
 
 # Extract declared checksum
-DECLARED_CHECKSUM=$(grep "^checksum_sha256:" "$FILE" | awk '{print $2}')
+DECLARED_CHECKSUM=$(printf '%s\n' "$CHECKSUM_LINES" | awk '{print $2}')
 
-# Create temp file without checksum line
-TEMP_FILE=$(mktemp)
-grep -v "^checksum_sha256:" "$FILE" > "$TEMP_FILE"
-
-# Calculate actual checksum
-ACTUAL_CHECKSUM=$(shasum -a 256 "$TEMP_FILE" | awk '{print $1}')
-
-# Clean up
-rm "$TEMP_FILE"
+# Calculate actual checksum over the file without its checksum line (no temp file)
+ACTUAL_CHECKSUM=$(grep -v "^checksum_sha256:" "$FILE" | shasum -a 256 | awk '{print $1}')
 
 # Compare
 if [ "$DECLARED_CHECKSUM" = "$ACTUAL_CHECKSUM" ]; then
@@ -8,8 +8,10 @@ REPO_ROOT="${1:-.}"
 echo "⟡⟦INTEGRITY CHECK⟧ — Verifying MirrorDNA checksums..."
 echo ""
 
-# Find all markdown files with checksums in front matter (within first 50 lines)
-FILES=$(find "$REPO_ROOT" -name "*.md" -type f -exec sh -c 'head -50 "$1" | grep -q "^checksum_sha256:" && echo "$1"' _ {} \;)
+# Find all markdown files with checksums in front matter (within first 50 lines).
+# One awk process scans the whole batch, stopping each file at the first match or line 50,
+# instead of spawning sh + head + grep per file.
+FILES=$(find "$REPO_ROOT" -name "*.md" -type f -exec awk 'FNR > 50 { nextfile } /^checksum_sha256:/ { print FILENAME; nextfile }' {} +)
 
 if [ -z "$FILES" ]; then
     echo "No files with checksums found in $REPO_ROOT"
@@ -26,11 +28,8 @@ for FILE in $FILES; do
     # Extract declared checksum from front matter (first 50 lines only)
     DECLARED=$(head -50 "$FILE" | grep "^checksum_sha256:" | head -1 | awk '{print $2}')
 
-    # Calculate actual checksum (excluding checksum line)
-    TEMP=$(mktemp)
-    grep -v "^checksum_sha256:" "$FILE" > "$TEMP"
-    ACTUAL=$(shasum -a 256 "$TEMP" | awk '{print $1}')
-    rm "$TEMP"
+    # Calculate actual checksum (excluding checksum line), piped rather than via a temp file
+    ACTUAL=$(grep -v "^checksum_sha256:" "$FILE" | shasum -a 256 | awk '{print $1}')
 
     # Compare
     if [ "$DECLARED" = "$ACTUAL" ]; then
@@ -28,13 +28,275 @@ This tool ensures that systems maintain philosophical integrity
 and constitutional compliance.
 """
 
+import hashlib
+import json
+import os
 import re
-from typing import Dict, Any, List, Tuple, Optional
+import sys
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain, repeat
+from typing import Dict, Any, List, Tuple, Optional, Set, Callable, NamedTuple, Union
 from enum import Enum
 from pathlib import Path
 
 
-class Principle(Enum):
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+
+# Default location of the on-disk audit cache (see ReflectiveReviewer)
+DEFAULT_CACHE_DIR = Path('.mirrordna_audit_cache')
+
+# Maximum number of cached reports kept after pruning
+DEFAULT_CACHE_ENTRIES = 4096
+
+# Files larger than this are not audited (generated or vendored content)
+MAX_AUDIT_FILE_SIZE = 2 * 1024 * 1024
+
+# Leading bytes inspected for NUL bytes to detect binary files
+BINARY_SNIFF_BYTES = 8192
+
+# Distinct contents whose findings are memoized in-process
+FINDINGS_MEMO_SIZE = 1024
+
+# audit_codebase only starts a process pool for at least this many files
+PARALLEL_MIN_FILES = 256
+
+# Files handed to each worker per task
+PARALLEL_CHUNK_SIZE = 32
+
+# Python 3.10+: slotted dataclasses, without a per-instance __dict__ (one
+# CodeFeatures is built per audited file, and findings are kept per report)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+class _FeatureSpec(NamedTuple):
+    """
+    How to detect one code feature.
+
+    Fixed strings are kept apart from structural patterns so regex engines
+    that gain nothing from them can use plain substring search instead.
+    Literals and patterns of case-insensitive features are written in
+    lowercase, so they can be matched against lowercased text without a
+    case-folding flag.
+    Features only consulted by size-gated checks set min_length to the
+    smallest code length at which any such check can fire.
+    """
+    literals: Tuple[str, ...]
+    pattern: Optional[str]
+    ignore_case: bool
+    min_length: int = 0
+
+    def regex(self) -> str:
+        """Full pattern source, literals included."""
+        alternatives = [re.escape(literal) for literal in self.literals]
+        if self.pattern:
+            alternatives.append(self.pattern)
+        return '|'.join(alternatives)
+
+
+# Principle features. Alternation lists are joined into a single spec per
+# feature.
+_FEATURE_PATTERNS: Dict[str, _FeatureSpec] = {
+    # Principle 1: Reflection Over Prediction
+    'vault_access': _FeatureSpec((), r'vault\.(read|get|load)', True),
+    'state_access': _FeatureSpec((), r'state\.(read|get|load)', True),
+    'prediction': _FeatureSpec(
+        ('.predict(', 'model.forward'),
+        r'predict\s*\(|generate\s*\(|simulate\s*\(',
+        True
+    ),
+    'hallucination': _FeatureSpec(
+        ('fabricate', 'invent', 'hallucinate'),
+        r'make\s+up',
+        True
+    ),
+
+    # Principle 2: Presence Over Productivity
+    'verification': _FeatureSpec(
+        ('verify', 'validate', 'check', 'confirm'),
+        None,
+        True
+    ),
+    'speed_optimization': _FeatureSpec(
+        (),
+        r'fast\s*=\s*true|skip.*verification|quick.*mode|speed.*optimize',
+        True
+    ),
+    'unknown_marker': _FeatureSpec(('[Unknown]',), None, False, 501),
+
+    # Principle 3: Symbolic Continuity
+    'vault_id': _FeatureSpec(('vault_id', 'VaultID'), None, False, 301),
+    'session_tracking': _FeatureSpec(
+        ('session_id',),
+        r'session.*tracking',
+        True,
+        301
+    ),
+    'checksum': _FeatureSpec(('checksum', 'sha256'), None, True, 301),
+    'lineage': _FeatureSpec(
+        ('predecessor', 'successor', 'lineage'),
+        None,
+        True,
+        301
+    ),
+    'glyph': _FeatureSpec((), r'⟡⟦[A-Z]+⟧', False),
+
+    # Principle 4: Trust by Design
+    'trust_marker': _FeatureSpec(
+        ('[Verified]', '⟡⟦VERIFIED⟧', '[Fact]', 'checksum'),
+        None,
+        False,
+        401
+    ),
+    'hidden_import': _FeatureSpec(
+        (),
+        r'import\s+\*|from\s+\S+\s+import\s+\*',
+        False
+    ),
+    'credential': _FeatureSpec(
+        (),
+        r'password\s*=\s*["\']|api_key\s*=\s*["\']|secret\s*=\s*["\']'
+        r'|token\s*=\s*["\'][a-z0-9]{20,}',
+        True
+    ),
+
+    # Principle 5: Explicit Uncertainty
+    'feu_marker': _FeatureSpec(
+        ('[Fact]', '[Estimate]', '[Unknown]'),
+        None,
+        False,
+        401
+    ),
+    'uncertainty': _FeatureSpec(
+        ('uncertain', 'unknown', 'unverified'),
+        r'not\s+sure|cannot\s+verify',
+        True,
+        401
+    ),
+    'cite_or_silence': _FeatureSpec(
+        ('cite_or_silence', 'ahp'),
+        r'cite.*silence',
+        True,
+        601
+    ),
+}
+
+
+def _hyperscan_scanner() -> Callable[[Union[str, bytes]], Set[str]]:
+    """
+    Build a scanner matching every feature in one Hyperscan pass.
+
+    min_length is ignored here: all features share the single pass, so
+    dropping some of them would not shorten it.
+    """
+    names = list(_FEATURE_PATTERNS)
+    base_flags = (
+        hyperscan.HS_FLAG_SINGLEMATCH
+        | hyperscan.HS_FLAG_UTF8
+        | hyperscan.HS_FLAG_UCP
+    )
+
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[
+            _FEATURE_PATTERNS[name].regex().encode('utf-8') for name in names
+        ],
+        ids=list(range(len(names))),
+        elements=len(names),
+        flags=[
+            base_flags | (hyperscan.HS_FLAG_CASELESS if spec.ignore_case else 0)
+            for spec in _FEATURE_PATTERNS.values()
+        ]
+    )
+
+    def on_match(pattern_id, start, end, flags, found):
+        found.add(names[pattern_id])
+
+    def scan(code: Union[str, bytes]) -> Set[str]:
+        if isinstance(code, str):
+            code = code.encode('utf-8', 'surrogatepass')
+        found: Set[str] = set()
+        database.scan(
+            code,
+            match_event_handler=on_match,
+            context=found
+        )
+        return found
+
+    return scan
+
+
+def _regex_scanner(engine: Any) -> Callable[[Union[str, bytes]], Set[str]]:
+    """
+    Build a scanner running one compiled pattern per feature.
+
+    Fixed strings are matched with substring search, which is much cheaper
+    than a regex dispatch. Case-insensitive literals and patterns run against
+    a single lowercased copy of the text instead of using IGNORECASE, which
+    would case-fold every character inside the matching loop. Features whose
+    min_length exceeds the code length are not scanned at all, so small files
+    only pay for the ungated checks.
+
+    Both str and (ASCII) bytes input are accepted; bytes are matched with
+    byte-compiled patterns, skipping the decode entirely.
+    """
+    def compile_checks(encode: Callable[[str], Any]) -> List[Tuple[Any, ...]]:
+        return [
+            (
+                name,
+                tuple(encode(literal) for literal in spec.literals),
+                engine.compile(encode(spec.pattern)) if spec.pattern else None,
+                spec.ignore_case,
+                spec.min_length
+            )
+            for name, spec in _FEATURE_PATTERNS.items()
+        ]
+
+    str_checks = compile_checks(lambda text: text)
+    bytes_checks = compile_checks(lambda text: text.encode('utf-8'))
+
+    def scan(code: Union[str, bytes]) -> Set[str]:
+        checks = bytes_checks if isinstance(code, bytes) else str_checks
+        code_len = len(code)
+        code_lower = code.lower()
+        found: Set[str] = set()
+
+        for name, literals, pattern, ignore_case, min_length in checks:
+            if code_len < min_length:
+                continue
+            text = code_lower if ignore_case else code
+            if any(literal in text for literal in literals):
+                found.add(name)
+            elif pattern is not None and pattern.search(text):
+                found.add(name)
+
+        return found
+
+    return scan
+
+
+# Hyperscan compiles every feature into one automaton scanned in a single
+# pass; RE2 guarantees linear-time matching; stdlib re is the fallback.
+if hyperscan is not None:
+    _scan_features = _hyperscan_scanner()
+elif re2 is not None:
+    _scan_features = _regex_scanner(re2)
+else:
+    _scan_features = _regex_scanner(re)
+
+
+class Principle(str, Enum):
     """MirrorDNA Core Principles"""
     REFLECTION_OVER_PREDICTION = "reflection_over_prediction"
     PRESENCE_OVER_PRODUCTIVITY = "presence_over_productivity"
@@ -43,7 +305,7 @@ class Principle(Enum):
     EXPLICIT_UNCERTAINTY = "explicit_uncertainty"
 
 
-class AuditSeverity(Enum):
+class AuditSeverity(str, Enum):
     """Audit finding severity levels"""
     PASS = "pass"
     WARNING = "warning"
@@ -51,36 +313,213 @@ class AuditSeverity(Enum):
     CRITICAL = "critical"
 
 
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class AuditFinding:
     """Represents an audit finding"""
-
-    def __init__(
-        self,
-        principle: Principle,
-        severity: AuditSeverity,
-        message: str,
-        location: Optional[str] = None,
-        recommendation: Optional[str] = None
-    ):
-        self.principle = principle
-        self.severity = severity
-        self.message = message
-        self.location = location
-        self.recommendation = recommendation
+    principle: Principle
+    severity: AuditSeverity
+    message: str
+    location: Optional[str] = None
+    recommendation: Optional[str] = None
+    _dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __repr__(self) -> str:
         loc_str = f" at {self.location}" if self.location else ""
         return f"[{self.severity.value.upper()}] {self.principle.value}{loc_str}: {self.message}"
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return {
-            'principle': self.principle.value,
-            'severity': self.severity.value,
-            'message': self.message,
-            'location': self.location,
-            'recommendation': self.recommendation
-        }
+        """
+        Convert to dictionary.
+
+        The dict is built once and shared by every report the finding
+        appears in, so callers must treat it as read-only.
+        """
+        if self._dict is None:
+            object.__setattr__(self, '_dict', {
+                'principle': self.principle.value,
+                'severity': self.severity.value,
+                'message': self.message,
+                'location': self.location,
+                'recommendation': self.recommendation
+            })
+        return self._dict
+
+    def key(self) -> Tuple[Any, ...]:
+        """Field tuple identifying the finding."""
+        return (
+            self.principle,
+            self.severity,
+            self.message,
+            self.location,
+            self.recommendation
+        )
+
+    def __reduce__(self):
+        # Pickle as a bare field tuple so findings returned by worker
+        # processes resolve back to the shared module-level instances.
+        return (_restore_finding, self.key())
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'AuditFinding':
+        """Rebuild a finding from its to_dict() form."""
+        return _restore_finding(
+            Principle(data['principle']),
+            AuditSeverity(data['severity']),
+            data['message'],
+            data.get('location'),
+            data.get('recommendation')
+        )
+
+
+def _restore_finding(*key: Any) -> AuditFinding:
+    """Return the shared finding for key, constructing one only if unknown."""
+    finding = _KNOWN_FINDINGS.get(key)
+    if finding is None:
+        finding = AuditFinding(*key)
+    return finding
+
+
+# Every finding the principle checks can raise. Findings carry no per-call
+# data, so each check appends one of these shared immutable instances
+# instead of constructing a new finding (and its dict) per audited file.
+_FINDING_UNGROUNDED_PREDICTION = AuditFinding(
+    Principle.REFLECTION_OVER_PREDICTION,
+    AuditSeverity.VIOLATION,
+    "Code uses prediction without vault/state grounding",
+    recommendation="Add vault.read() or state.get() before generation"
+)
+_FINDING_HALLUCINATION_RISK = AuditFinding(
+    Principle.REFLECTION_OVER_PREDICTION,
+    AuditSeverity.WARNING,
+    "Code contains hallucination-risk keywords",
+    recommendation="Ensure all outputs are grounded in vault/sources"
+)
+_FINDING_UNVERIFIED_SPEED_OPTIMIZATION = AuditFinding(
+    Principle.PRESENCE_OVER_PRODUCTIVITY,
+    AuditSeverity.WARNING,
+    "Speed optimization without verification checks",
+    recommendation="Add verification steps even in optimized paths"
+)
+_FINDING_NO_UNKNOWN_HANDLING = AuditFinding(
+    Principle.PRESENCE_OVER_PRODUCTIVITY,
+    AuditSeverity.WARNING,
+    "No [Unknown] handling found in significant codebase",
+    recommendation="Add explicit [Unknown] markers for uncertain outputs"
+)
+_FINDING_NO_CONTINUITY = AuditFinding(
+    Principle.SYMBOLIC_CONTINUITY,
+    AuditSeverity.VIOLATION,
+    "No symbolic continuity mechanisms found",
+    recommendation="Add vault_id, session_id, checksum, or lineage tracking"
+)
+_FINDING_LIMITED_CONTINUITY = AuditFinding(
+    Principle.SYMBOLIC_CONTINUITY,
+    AuditSeverity.WARNING,
+    "Limited symbolic continuity (fewer than 2 mechanisms)",
+    recommendation="Implement multiple continuity markers for robustness"
+)
+_FINDING_MISSING_GLYPHS = AuditFinding(
+    Principle.SYMBOLIC_CONTINUITY,
+    AuditSeverity.WARNING,
+    "Standard file missing glyph signatures",
+    recommendation="Add appropriate glyph signatures (⟡⟦CONTINUITY⟧, etc.)"
+)
+_FINDING_NO_TRUST_MARKERS = AuditFinding(
+    Principle.TRUST_BY_DESIGN,
+    AuditSeverity.WARNING,
+    "No trust markers found",
+    recommendation="Add verification markers ([Verified], checksums, etc.)"
+)
+_FINDING_WILDCARD_IMPORT = AuditFinding(
+    Principle.TRUST_BY_DESIGN,
+    AuditSeverity.WARNING,
+    "Wildcard imports hide dependencies",
+    recommendation="Use explicit imports for transparency"
+)
+_FINDING_HARDCODED_CREDENTIALS = AuditFinding(
+    Principle.TRUST_BY_DESIGN,
+    AuditSeverity.CRITICAL,
+    "Hard-coded credentials found (security violation)",
+    recommendation="Use environment variables or secure vault storage"
+)
+_FINDING_NO_UNCERTAINTY_HANDLING = AuditFinding(
+    Principle.EXPLICIT_UNCERTAINTY,
+    AuditSeverity.WARNING,
+    "No explicit uncertainty handling found",
+    recommendation="Add FEU markers ([Fact], [Estimate], [Unknown])"
+)
+_FINDING_NO_CITE_OR_SILENCE = AuditFinding(
+    Principle.EXPLICIT_UNCERTAINTY,
+    AuditSeverity.WARNING,
+    "Cite-or-Silence (AHP) not implemented",
+    recommendation="Implement Cite-or-Silence anti-hallucination protocol"
+)
+
+_KNOWN_FINDINGS: Dict[Tuple[Any, ...], AuditFinding] = {
+    finding.key(): finding
+    for finding in (
+        _FINDING_UNGROUNDED_PREDICTION,
+        _FINDING_HALLUCINATION_RISK,
+        _FINDING_UNVERIFIED_SPEED_OPTIMIZATION,
+        _FINDING_NO_UNKNOWN_HANDLING,
+        _FINDING_NO_CONTINUITY,
+        _FINDING_LIMITED_CONTINUITY,
+        _FINDING_MISSING_GLYPHS,
+        _FINDING_NO_TRUST_MARKERS,
+        _FINDING_WILDCARD_IMPORT,
+        _FINDING_HARDCODED_CREDENTIALS,
+        _FINDING_NO_UNCERTAINTY_HANDLING,
+        _FINDING_NO_CITE_OR_SILENCE,
+    )
+}
+
+
+# LRU memo of findings keyed by (reviewer class, content digest, is_standard)
+_FINDINGS_MEMO: 'OrderedDict[Tuple[Any, ...], Tuple[AuditFinding, ...]]' = OrderedDict()
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class CodeFeatures:
+    """
+    Principle-relevant features of audited code, extracted in one scan.
+
+    Features only used by size-gated checks may be left unscanned (False)
+    when code_len is below the gate.
+    """
+    code_len: int
+    has_vault_access: bool = False
+    has_state_access: bool = False
+    has_prediction: bool = False
+    has_hallucination: bool = False
+    has_verification: bool = False
+    has_speed_optimization: bool = False
+    has_unknown_marker: bool = False
+    has_vault_id: bool = False
+    has_session_tracking: bool = False
+    has_checksum: bool = False
+    has_lineage: bool = False
+    has_glyph: bool = False
+    has_trust_marker: bool = False
+    has_hidden_import: bool = False
+    has_credential: bool = False
+    has_feu_marker: bool = False
+    has_uncertainty: bool = False
+    has_cite_or_silence: bool = False
+
+    @classmethod
+    def extract(cls, code: Union[str, bytes]) -> 'CodeFeatures':
+        """
+        Scan code once and record every feature found.
+
+        Args:
+            code: Text to scan, or pure-ASCII bytes (one byte per character)
+        """
+        return cls(
+            len(code),
+            **{f'has_{name}': True for name in _scan_features(code)}
+        )
 
 
 class ReflectiveReviewer:
@@ -91,57 +530,77 @@ class ReflectiveReviewer:
     constitutional principles.
     """
 
-    def __init__(self, strict_mode: bool = False):
+    def __init__(
+        self,
+        strict_mode: bool = False,
+        cache_dir: Optional[Path] = None
+    ):
         """
         Initialize Reflective Reviewer.
 
         Args:
             strict_mode: If True, treat warnings as violations
+            cache_dir: Optional directory caching file reports by content
+                hash, so unchanged files are not re-audited
         """
         self.strict_mode = strict_mode
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         self.findings: List[AuditFinding] = []
 
     def audit_implementation(
         self,
-        code: str,
+        code: Union[str, bytes],
         context: Optional[Dict[str, Any]] = None
     ) -> List[AuditFinding]:
         """
         Audit code implementation against all principles.
 
         Args:
-            code: Code to audit
+            code: Code to audit. Bytes are decoded as UTF-8 only if they
+                are not pure ASCII; ASCII bytes are scanned as they are.
             context: Optional context (file path, module name, etc.)
 
         Returns:
             List of audit findings
         """
+        # Identical content (boilerplate, vendored copies, templated
+        # __init__.py files) is only scanned once per process.
+        memo_key = (
+            type(self),
+            hashlib.blake2b(
+                code if isinstance(code, bytes)
+                else code.encode('utf-8', 'surrogatepass'),
+                digest_size=16
+            ).digest(),
+            bool(context and context.get('is_standard_file'))
+        )
+        memoized = _FINDINGS_MEMO.get(memo_key)
+        if memoized is not None:
+            _FINDINGS_MEMO.move_to_end(memo_key)
+            self.findings = list(memoized)
+            return self.findings
+
         self.findings = []
+        if isinstance(code, bytes) and not code.isascii():
+            code = code.decode('utf-8', errors='replace')
+        features = CodeFeatures.extract(code)
 
         # Run all principle checks
-        self._check_reflection_over_prediction(code, context)
-        self._check_presence_over_productivity(code, context)
-        self._check_symbolic_continuity(code, context)
-        self._check_trust_by_design(code, context)
-        self._check_explicit_uncertainty(code, context)
+        self._check_reflection_over_prediction(features, context)
+        self._check_presence_over_productivity(features, context)
+        self._check_symbolic_continuity(features, context)
+        self._check_trust_by_design(features, context)
+        self._check_explicit_uncertainty(features, context)
 
-        return self.findings
+        _FINDINGS_MEMO[memo_key] = tuple(self.findings)
+        if len(_FINDINGS_MEMO) > FINDINGS_MEMO_SIZE:
+            _FINDINGS_MEMO.popitem(last=False)
 
-    def _add_finding(
-        self,
-        principle: Principle,
-        severity: AuditSeverity,
-        message: str,
-        location: Optional[str] = None,
-        recommendation: Optional[str] = None
-    ) -> None:
-        """Add finding to audit results."""
-        finding = AuditFinding(principle, severity, message, location, recommendation)
-        self.findings.append(finding)
+        return self.findings
 
     def _check_reflection_over_prediction(
         self,
-        code: str,
+        features: CodeFeatures,
         context: Optional[Dict[str, Any]] = None
     ) -> None:
         """
@@ -153,50 +612,22 @@ class ReflectiveReviewer:
         - Pattern matching instead of state access
         """
         # Check for vault access
-        has_vault_access = bool(re.search(r'vault\.(read|get|load)', code, re.I))
-        has_state_access = bool(re.search(r'state\.(read|get|load)', code, re.I))
+        has_vault_access = features.has_vault_access
+        has_state_access = features.has_state_access
 
         # Check for prediction patterns
-        prediction_patterns = [
-            r'predict\s*\(',
-            r'generate\s*\(',
-            r'simulate\s*\(',
-            r'\.predict\(',
-            r'model\.forward'
-        ]
-
-        has_prediction = any(
-            re.search(pattern, code, re.I)
-            for pattern in prediction_patterns
-        )
+        has_prediction = features.has_prediction
 
         if has_prediction and not (has_vault_access or has_state_access):
-            self._add_finding(
-                Principle.REFLECTION_OVER_PREDICTION,
-                AuditSeverity.VIOLATION,
-                "Code uses prediction without vault/state grounding",
-                recommendation="Add vault.read() or state.get() before generation"
-            )
+            self.findings.append(_FINDING_UNGROUNDED_PREDICTION)
 
         # Check for hallucination risk
-        hallucination_patterns = [
-            r'fabricate',
-            r'make\s+up',
-            r'invent',
-            r'hallucinate'
-        ]
-
-        if any(re.search(p, code, re.I) for p in hallucination_patterns):
-            self._add_finding(
-                Principle.REFLECTION_OVER_PREDICTION,
-                AuditSeverity.WARNING,
-                "Code contains hallucination-risk keywords",
-                recommendation="Ensure all outputs are grounded in vault/sources"
-            )
+        if features.has_hallucination:
+            self.findings.append(_FINDING_HALLUCINATION_RISK)
 
     def _check_presence_over_productivity(
         self,
-        code: str,
+        features: CodeFeatures,
         context: Optional[Dict[str, Any]] = None
     ) -> None:
         """
@@ -208,47 +639,23 @@ class ReflectiveReviewer:
         - Batch processing without reflection
         """
         # Check for verification steps
-        has_verification = bool(re.search(
-            r'(verify|validate|check|confirm)',
-            code,
-            re.I
-        ))
+        has_verification = features.has_verification
 
         # Check for fast/optimization patterns
-        optimization_patterns = [
-            r'fast\s*=\s*True',
-            r'skip.*verification',
-            r'quick.*mode',
-            r'speed.*optimize'
-        ]
-
-        has_speed_optimization = any(
-            re.search(p, code, re.I)
-            for p in optimization_patterns
-        )
+        has_speed_optimization = features.has_speed_optimization
 
         if has_speed_optimization and not has_verification:
-            self._add_finding(
-                Principle.PRESENCE_OVER_PRODUCTIVITY,
-                AuditSeverity.WARNING,
-                "Speed optimization without verification checks",
-                recommendation="Add verification steps even in optimized paths"
-            )
+            self.findings.append(_FINDING_UNVERIFIED_SPEED_OPTIMIZATION)
 
         # Check for [Unknown] handling
-        handles_unknown = bool(re.search(r'\[Unknown\]', code))
-
-        if not handles_unknown and len(code) > 500:
-            self._add_finding(
-                Principle.PRESENCE_OVER_PRODUCTIVITY,
-                AuditSeverity.WARNING,
-                "No [Unknown] handling found in significant codebase",
-                recommendation="Add explicit [Unknown] markers for uncertain outputs"
-            )
+        handles_unknown = features.has_unknown_marker
+
+        if not handles_unknown and features.code_len > 500:
+            self.findings.append(_FINDING_NO_UNKNOWN_HANDLING)
 
     def _check_symbolic_continuity(
         self,
-        code: str,
+        features: CodeFeatures,
         context: Optional[Dict[str, Any]] = None
     ) -> None:
         """
@@ -261,24 +668,16 @@ class ReflectiveReviewer:
         - Missing glyph signatures
         """
         # Check for VaultID usage
-        has_vault_id = bool(re.search(r'vault_id|VaultID', code))
+        has_vault_id = features.has_vault_id
 
         # Check for session tracking
-        has_session_tracking = bool(re.search(
-            r'session_id|session.*tracking',
-            code,
-            re.I
-        ))
+        has_session_tracking = features.has_session_tracking
 
         # Check for checksum
-        has_checksum = bool(re.search(r'checksum|sha256', code, re.I))
+        has_checksum = features.has_checksum
 
         # Check for lineage
-        has_lineage = bool(re.search(
-            r'(predecessor|successor|lineage)',
-            code,
-            re.I
-        ))
+        has_lineage = features.has_lineage
 
         # Count violations
         continuity_features = sum([
@@ -288,35 +687,20 @@ class ReflectiveReviewer:
             has_lineage
         ])
 
-        if continuity_features == 0 and len(code) > 300:
-            self._add_finding(
-                Principle.SYMBOLIC_CONTINUITY,
-                AuditSeverity.VIOLATION,
-                "No symbolic continuity mechanisms found",
-                recommendation="Add vault_id, session_id, checksum, or lineage tracking"
-            )
-        elif continuity_features < 2 and len(code) > 500:
-            self._add_finding(
-                Principle.SYMBOLIC_CONTINUITY,
-                AuditSeverity.WARNING,
-                "Limited symbolic continuity (fewer than 2 mechanisms)",
-                recommendation="Implement multiple continuity markers for robustness"
-            )
+        if continuity_features == 0 and features.code_len > 300:
+            self.findings.append(_FINDING_NO_CONTINUITY)
+        elif continuity_features < 2 and features.code_len > 500:
+            self.findings.append(_FINDING_LIMITED_CONTINUITY)
 
         # Check for glyph signatures
-        has_glyphs = bool(re.search(r'⟡⟦[A-Z]+⟧', code))
+        has_glyphs = features.has_glyph
 
         if not has_glyphs and context and context.get('is_standard_file'):
-            self._add_finding(
-                Principle.SYMBOLIC_CONTINUITY,
-                AuditSeverity.WARNING,
-                "Standard file missing glyph signatures",
-                recommendation="Add appropriate glyph signatures (⟡⟦CONTINUITY⟧, etc.)"
-            )
+            self.findings.append(_FINDING_MISSING_GLYPHS)
 
     def _check_trust_by_design(
         self,
-        code: str,
+        features: CodeFeatures,
         context: Optional[Dict[str, Any]] = None
     ) -> None:
         """
@@ -328,74 +712,25 @@ class ReflectiveReviewer:
         - Hidden dependencies
         - Lack of transparency
         """
-        # Check for checksum validation
-        has_checksum_validation = bool(re.search(
-            r'(verify.*checksum|validate.*checksum|checksum.*verify)',
-            code,
-            re.I
-        ))
-
-        # Check for citation
-        has_citation = bool(re.search(
-            r'(cite|source|reference|attribution)',
-            code,
-            re.I
-        ))
-
         # Check for trust markers
-        trust_markers = [
-            r'\[Verified\]',
-            r'⟡⟦VERIFIED⟧',
-            r'\[Fact\]',
-            r'checksum'
-        ]
-
-        has_trust_markers = any(
-            re.search(marker, code)
-            for marker in trust_markers
-        )
+        has_trust_markers = features.has_trust_marker
 
-        if not has_trust_markers and len(code) > 400:
-            self._add_finding(
-                Principle.TRUST_BY_DESIGN,
-                AuditSeverity.WARNING,
-                "No trust markers found",
-                recommendation="Add verification markers ([Verified], checksums, etc.)"
-            )
+        if not has_trust_markers and features.code_len > 400:
+            self.findings.append(_FINDING_NO_TRUST_MARKERS)
 
         # Check for hidden dependencies
-        has_hidden_import = bool(re.search(
-            r'import\s+\*|from\s+\S+\s+import\s+\*',
-            code
-        ))
+        has_hidden_import = features.has_hidden_import
 
         if has_hidden_import:
-            self._add_finding(
-                Principle.TRUST_BY_DESIGN,
-                AuditSeverity.WARNING,
-                "Wildcard imports hide dependencies",
-                recommendation="Use explicit imports for transparency"
-            )
+            self.findings.append(_FINDING_WILDCARD_IMPORT)
 
         # Check for hard-coded credentials (security risk)
-        credential_patterns = [
-            r'password\s*=\s*["\']',
-            r'api_key\s*=\s*["\']',
-            r'secret\s*=\s*["\']',
-            r'token\s*=\s*["\'][a-zA-Z0-9]{20,}'
-        ]
-
-        if any(re.search(p, code, re.I) for p in credential_patterns):
-            self._add_finding(
-                Principle.TRUST_BY_DESIGN,
-                AuditSeverity.CRITICAL,
-                "Hard-coded credentials found (security violation)",
-                recommendation="Use environment variables or secure vault storage"
-            )
+        if features.has_credential:
+            self.findings.append(_FINDING_HARDCODED_CREDENTIALS)
 
     def _check_explicit_uncertainty(
         self,
-        code: str,
+        features: CodeFeatures,
         context: Optional[Dict[str, Any]] = None
     ) -> None:
         """
@@ -408,50 +743,19 @@ class ReflectiveReviewer:
         - Smoothing over uncertainty
         """
         # Check for FEU markers
-        feu_markers = [
-            r'\[Fact\]',
-            r'\[Estimate\]',
-            r'\[Unknown\]'
-        ]
-
-        has_feu = any(re.search(marker, code) for marker in feu_markers)
+        has_feu = features.has_feu_marker
 
         # Check for uncertainty handling
-        uncertainty_keywords = [
-            r'uncertain',
-            r'unknown',
-            r'not\s+sure',
-            r'cannot\s+verify',
-            r'unverified'
-        ]
+        handles_uncertainty = features.has_uncertainty
 
-        handles_uncertainty = any(
-            re.search(kw, code, re.I)
-            for kw in uncertainty_keywords
-        )
-
-        if not has_feu and not handles_uncertainty and len(code) > 400:
-            self._add_finding(
-                Principle.EXPLICIT_UNCERTAINTY,
-                AuditSeverity.WARNING,
-                "No explicit uncertainty handling found",
-                recommendation="Add FEU markers ([Fact], [Estimate], [Unknown])"
-            )
+        if not has_feu and not handles_uncertainty and features.code_len > 400:
+            self.findings.append(_FINDING_NO_UNCERTAINTY_HANDLING)
 
         # Check for fabrication prevention
-        has_cite_or_silence = bool(re.search(
-            r'(cite.*silence|cite_or_silence|AHP)',
-            code,
-            re.I
-        ))
-
-        if not has_cite_or_silence and len(code) > 600:
-            self._add_finding(
-                Principle.EXPLICIT_UNCERTAINTY,
-                AuditSeverity.WARNING,
-                "Cite-or-Silence (AHP) not implemented",
-                recommendation="Implement Cite-or-Silence anti-hallucination protocol"
-            )
+        has_cite_or_silence = features.has_cite_or_silence
+
+        if not has_cite_or_silence and features.code_len > 600:
+            self.findings.append(_FINDING_NO_CITE_OR_SILENCE)
 
     def generate_audit_report(self) -> Dict[str, Any]:
         """
@@ -460,24 +764,26 @@ class ReflectiveReviewer:
         Returns:
             Audit report dict
         """
+        # Count (principle, severity) pairs in a single pass, then fold the
+        # handful of distinct pairs into per-severity and per-principle counts
+        pair_counts = Counter((f.principle, f.severity) for f in self.findings)
+        severity_counter: Counter = Counter()
+        principle_counter: Counter = Counter()
+        for (principle, severity), count in pair_counts.items():
+            severity_counter[severity] += count
+            principle_counter[principle] += count
+
         # Count by severity
         severity_counts = {
-            'pass': 0,
-            'warning': 0,
-            'violation': 0,
-            'critical': 0
+            severity.value: severity_counter[severity]
+            for severity in AuditSeverity
         }
 
-        for finding in self.findings:
-            severity_counts[finding.severity.value] += 1
-
         # Count by principle
-        principle_counts = {}
-        for principle in Principle:
-            principle_counts[principle.value] = sum(
-                1 for f in self.findings
-                if f.principle == principle
-            )
+        principle_counts = {
+            principle.value: principle_counter[principle]
+            for principle in Principle
+        }
 
         # Calculate compliance score
         total_issues = len(self.findings)
@@ -513,51 +819,309 @@ class ReflectiveReviewer:
         Returns:
             Audit report
         """
-        content = file_path.read_text(encoding='utf-8')
+        content = _read_source(file_path)
+        if content is None:
+            raise ValueError(
+                f"{file_path} is binary or larger than {MAX_AUDIT_FILE_SIZE} bytes"
+            )
+
+        return self._audit_source(file_path, content)
+
+    def _audit_source(self, file_path: Path, content: bytes) -> Dict[str, Any]:
+        """
+        Audit already-read file content, consulting the cache.
+
+        Raises:
+            UnicodeDecodeError: If the content is not valid UTF-8
+        """
+        # ASCII is scanned as bytes; anything else must decode strictly,
+        # as Path.read_text would, before it is audited or cached
+        code = content if content.isascii() else content.decode('utf-8')
 
         context = {
             'file_path': str(file_path),
             'is_standard_file': 'spec/' in str(file_path) or 'standard' in str(file_path).lower()
         }
 
-        self.audit_implementation(content, context)
-        report = self.generate_audit_report()
+        cache_path = self._cache_path(content, context)
+        report = self._load_cached_report(cache_path)
+
+        if report is None:
+            self.audit_implementation(code, context)
+            report = self.generate_audit_report()
+            self._store_cached_report(cache_path, report)
+
         report['file_path'] = str(file_path)
 
         return report
 
+    def _cache_path(
+        self,
+        content: bytes,
+        context: Dict[str, Any]
+    ) -> Optional[Path]:
+        """
+        Get the cache entry for content audited under context.
+
+        The key covers the content, the context flags that affect findings,
+        and the reviewer source itself, so rule changes invalidate the cache.
+        """
+        if self.cache_dir is None:
+            return None
+
+        digest = hashlib.sha256(_rules_digest())
+        digest.update(b'standard' if context.get('is_standard_file') else b'plain')
+        digest.update(content)
+
+        return self.cache_dir / f"{digest.hexdigest()}.json"
+
+    def _load_cached_report(
+        self,
+        cache_path: Optional[Path]
+    ) -> Optional[Dict[str, Any]]:
+        """Load a cached report and restore its findings, if present."""
+        if cache_path is None:
+            return None
+
+        try:
+            report = json.loads(cache_path.read_text(encoding='utf-8'))
+            self.findings = [AuditFinding.from_dict(f) for f in report['findings']]
+        except (OSError, ValueError, KeyError):
+            return None
+
+        # Refresh mtime so pruning evicts least recently used entries
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+
+        return report
+
+    def _store_cached_report(
+        self,
+        cache_path: Optional[Path],
+        report: Dict[str, Any]
+    ) -> None:
+        """Write a report to the cache atomically."""
+        if cache_path is None:
+            return
+
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+            tmp_path.write_text(json.dumps(report), encoding='utf-8')
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"Warning: could not write audit cache {cache_path}: {e}")
+
+    def prune_cache(self, max_entries: int = DEFAULT_CACHE_ENTRIES) -> int:
+        """
+        Evict least recently used cache entries beyond max_entries.
+
+        Args:
+            max_entries: Number of most recently used entries to keep
+
+        Returns:
+            Number of entries removed
+        """
+        if self.cache_dir is None or not self.cache_dir.is_dir():
+            return 0
+
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith('.json'):
+                try:
+                    entries.append((entry.stat().st_mtime, entry.path))
+                except OSError:
+                    continue
+
+        if len(entries) <= max_entries:
+            return 0
+
+        entries.sort(reverse=True)
+        removed = 0
+        for _, path in entries[max_entries:]:
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass
+
+        return removed
+
+
+def _read_source(file_path: Path) -> Optional[bytes]:
+    """
+    Read a file for auditing.
+
+    Content is returned undecoded, but with CRLF and CR line endings
+    converted to LF as Path.read_text would, so they do not count towards
+    the length thresholds.
+
+    Returns:
+        File content, or None if the file is binary or larger than
+        MAX_AUDIT_FILE_SIZE
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size > MAX_AUDIT_FILE_SIZE:
+            return None
+
+        head = f.read(BINARY_SNIFF_BYTES)
+        if b'\0' in head:
+            return None
+
+        content = head + f.read()
+
+    if b'\r' in content:
+        content = content.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    return content
+
+
+@lru_cache(maxsize=None)
+def _rules_digest() -> bytes:
+    """Digest of this module's source, used to version cached reports."""
+    return hashlib.sha256(Path(__file__).read_bytes()).digest()
+
+
+def _collect_files(
+    root_path: Path,
+    extensions: List[str]
+) -> List[Tuple[Path, int]]:
+    """
+    Collect files under root_path with one of the given extensions.
+
+    Walks the tree once with os.scandir, matching extensions by set
+    lookup, instead of one recursive glob per extension. File sizes come
+    from the directory entries, so no extra stat call is needed.
+
+    Entries are visited in sorted order, so each directory's files are
+    contiguous and the result is deterministic; reading them in that order
+    keeps directory and inode metadata hot in the page cache.
+
+    Args:
+        root_path: Root directory to walk
+        extensions: File extensions to include (e.g. '.py')
+
+    Returns:
+        Matching (path, size) pairs
+    """
+    ext_set = frozenset(extensions)
+    files: List[Tuple[Path, int]] = []
+    pending = [str(root_path)]
+
+    while pending:
+        subdirs = []
+        try:
+            with os.scandir(pending.pop()) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError as e:
+            print(f"Error scanning {e.filename}: {e.strerror}")
+            continue
+        for entry in entries:
+            # An entry that cannot be stat'ed (e.g. a dangling symlink) is
+            # skipped on its own; the rest of the directory is still collected
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif os.path.splitext(entry.name)[1] in ext_set and entry.is_file():
+                    files.append((Path(entry.path), entry.stat().st_size))
+            except OSError as e:
+                print(f"Error scanning {entry.path}: {e.strerror}")
+        # Stack is LIFO: push in reverse so subdirectories pop in order
+        pending.extend(reversed(subdirs))
+
+    return files
+
+
+def _audit_one(
+    file_path: Path,
+    cache_dir: Optional[Path] = None
+) -> Tuple[Optional[Dict[str, Any]], List[AuditFinding], Optional[str]]:
+    """
+    Audit a single file; module-level so it can run in worker processes.
+
+    Returns:
+        (report, findings, error) where error is set if the audit failed;
+        report and error are both None for skipped binary files
+    """
+    reviewer = ReflectiveReviewer(cache_dir=cache_dir)
+    try:
+        content = _read_source(file_path)
+        if content is None:
+            return None, [], None
+        report = reviewer._audit_source(file_path, content)
+    except Exception as e:
+        return None, [], str(e)
+    return report, reviewer.findings, None
+
 
 def audit_codebase(
     root_path: Path,
-    extensions: List[str] = ['.py', '.md', '.yaml', '.yml']
+    extensions: List[str] = ['.py', '.md', '.yaml', '.yml'],
+    cache_dir: Optional[Path] = None,
+    max_workers: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Audit entire codebase for principle compliance.
 
+    Files are audited in parallel across a process pool once there are
+    enough of them to amortize the worker start-up cost. Binary files and
+    files over MAX_AUDIT_FILE_SIZE are skipped and counted separately.
+
     Args:
         root_path: Root directory to audit
         extensions: File extensions to audit
+        cache_dir: Optional audit cache directory (see ReflectiveReviewer)
+        max_workers: Worker processes to use (None = CPU count, 1 = serial)
 
     Returns:
         Aggregate audit report
     """
-    reviewer = ReflectiveReviewer()
-    all_findings: List[AuditFinding] = []
+    reviewer = ReflectiveReviewer(cache_dir=cache_dir)
+    file_findings: List[List[AuditFinding]] = []
     file_reports = []
 
-    for ext in extensions:
-        for file_path in root_path.glob(f'**/*{ext}'):
-            try:
-                report = reviewer.audit_file(file_path)
-                file_reports.append(report)
-                all_findings.extend(reviewer.findings)
-            except Exception as e:
-                print(f"Error auditing {file_path}: {e}")
+    file_paths = []
+    files_skipped = 0
+    for file_path, size in _collect_files(root_path, extensions):
+        if size > MAX_AUDIT_FILE_SIZE:
+            files_skipped += 1
+        else:
+            file_paths.append(file_path)
+
+    if max_workers == 1 or len(file_paths) < PARALLEL_MIN_FILES:
+        results = map(_audit_one, file_paths, repeat(cache_dir))
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+        results = executor.map(
+            _audit_one,
+            file_paths,
+            repeat(cache_dir),
+            chunksize=PARALLEL_CHUNK_SIZE
+        )
+
+    try:
+        for file_path, (report, findings, error) in zip(file_paths, results):
+            if error is not None:
+                print(f"Error auditing {file_path}: {error}")
+                continue
+            if report is None:
+                files_skipped += 1
+                continue
+            file_reports.append(report)
+            file_findings.append(findings)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    reviewer.prune_cache()
 
     # Aggregate report
-    reviewer.findings = all_findings
+    reviewer.findings = list(chain.from_iterable(file_findings))
     aggregate_report = reviewer.generate_audit_report()
     aggregate_report['files_audited'] = len(file_reports)
+    aggregate_report['files_skipped'] = files_skipped
     aggregate_report['file_reports'] = file_reports
 
     return aggregate_report
@@ -565,23 +1129,29 @@ def audit_codebase(
 
 if __name__ == "__main__":
     import sys
-    import json
     import argparse
 
     parser = argparse.ArgumentParser(description="MirrorDNA Reflective Reviewer")
     parser.add_argument('path', help='File or directory to audit')
     parser.add_argument('--strict', action='store_true', help='Strict mode')
     parser.add_argument('--json', action='store_true', help='Output as JSON')
+    parser.add_argument(
+        '--cache-dir',
+        nargs='?',
+        const=DEFAULT_CACHE_DIR,
+        type=Path,
+        help=f'Cache reports of unchanged files (default: {DEFAULT_CACHE_DIR})'
+    )
 
     args = parser.parse_args()
 
     path = Path(args.path)
 
     if path.is_file():
-        reviewer = ReflectiveReviewer(strict_mode=args.strict)
+        reviewer = ReflectiveReviewer(strict_mode=args.strict, cache_dir=args.cache_dir)
         report = reviewer.audit_file(path)
     elif path.is_dir():
-        report = audit_codebase(path)
+        report = audit_codebase(path, cache_dir=args.cache_dir)
     else:
         print(f"Error: {path} is not a valid file or directory")
         sys.exit(1)
@@ -26,10 +26,113 @@ and drift detection capabilities.
 """
 
 import re
+import os
+import json
 import hashlib
 from typing import Dict, Any, List, Tuple, Optional
 from enum import Enum
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Fabrication signatures checked by detect_hallucination, in reporting order
+_HALLUCINATION_PATTERNS = (
+    (re.compile(r'(?:VaultID|vault_id):\s*AMOS://[^\s]+'), 'fabricated_vault_id'),
+    (re.compile(r'⟡⟦[A-Z]+⟧'), 'fabricated_glyph'),
+    (re.compile(r'Checksum:\s*[0-9a-fA-F]{64}'), 'fabricated_checksum'),
+    (re.compile(r'Predecessor:\s*AMOS://'), 'fabricated_lineage'),
+)
+
+# Literals at least one of which every pattern above requires
+# (the lineage pattern needs 'AMOS://', as does the vault-id one)
+_HALLUCINATION_TOKENS = ('AMOS://', '⟡⟦', 'Checksum:')
+
+# Hedging phrases that downgrade an unsourced statement to [Estimate]
+_UNCERTAINTY_MARKERS = (
+    'might', 'maybe', 'possibly', 'probably', 'likely',
+    'appears', 'seems', 'could be', 'may be', 'should be'
+)
+
+
+def _uncertainty_matcher():
+    """Build a ``text -> bool`` test for any uncertainty marker in lowercased text.
+
+    With pyahocorasick the ten markers share one automaton and the text is
+    scanned once; otherwise each marker is a separate substring test.
+    """
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for marker in _UNCERTAINTY_MARKERS:
+            automaton.add_word(marker, marker)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+    return lambda text: any(marker in text for marker in _UNCERTAINTY_MARKERS)
+
+
+_has_uncertainty_marker = _uncertainty_matcher()
+
+# Sentence boundary for enforce_feu_on_text: whitespace after . ! or ?
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Vaults with at least this many markdown files are read on a thread pool
+_PARALLEL_INDEX_MIN_FILES = 32
+
+_VAULT_ID_RE = re.compile(r'(?:vault_id|VaultID):\s*(\S+)')
+
+
+def _iter_markdown_files(root: Path) -> List[Path]:
+    """
+    List ``*.md`` entries under root, like ``root.glob('**/*.md')``.
+
+    Walks with os.scandir on plain string paths and builds a Path only for
+    matches. Order matches pathlib's glob (each directory's matches, then its
+    subdirectories depth-first, in scandir order), and, like glob, hidden
+    entries are included and symlinked directories are not descended into.
+    """
+    matches: List[Path] = []
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            if os.path.normcase(entry.name).endswith('.md'):
+                matches.append(Path(entry.path))
+            try:
+                if entry.is_dir() and not entry.is_symlink():
+                    subdirs.append(entry.path)
+            except OSError:
+                continue
+        # Reversed so the first subdirectory is popped (walked) first
+        stack.extend(reversed(subdirs))
+    return matches
+
+
+def _decode_text(data: bytes) -> str:
+    """Decode file bytes the way ``Path.read_text`` does (UTF-8, universal newlines)."""
+    text = data.decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _lower_utf8(text: str) -> bytes:
+    """Lowercase ``text`` and encode it as UTF-8 for case-insensitive vault search.
+
+    Containment between UTF-8 encodings matches containment between the
+    strings themselves, so search results are unchanged; the lowered vault
+    copies just take 1-3 bytes per character instead of up to 4.
+    """
+    return text.lower().encode('utf-8', 'surrogatepass')
 
 
 class TruthState(Enum):
@@ -46,6 +149,20 @@ class DriftLevel(Enum):
     CRITICAL = "critical"
 
 
+# Report counter for each (non-hallucinated) truth state
+_TALLY_KEYS = {
+    TruthState.FACT: 'facts',
+    TruthState.ESTIMATE: 'estimates',
+    TruthState.UNKNOWN: 'unknowns',
+}
+
+# Prefix tag_statement puts on a non-Fact statement when there is no context
+_FEU_TAG_PREFIXES = {state: f"[{state.value}] " for state in TruthState}
+
+# State keys whose change between sessions is critical drift, in reporting order
+_CRITICAL_DRIFT_KEYS = ('vault_id', 'session_id', 'master_citation_version')
+
+
 class TruthStateEnforcer:
     """
     Enforces Auto-FEU Constitutional Law across MirrorDNA systems.
@@ -57,17 +174,33 @@ class TruthStateEnforcer:
     4. Detect continuity drift
     """
 
-    def __init__(self, vault_path: Optional[Path] = None, strict_mode: bool = True):
+    def __init__(
+        self,
+        vault_path: Optional[Path] = None,
+        strict_mode: bool = True,
+        index_cache: Optional[Path] = None
+    ):
         """
         Initialize Truth-State Enforcer.
 
         Args:
             vault_path: Path to vault for fact verification
             strict_mode: If True, enforce strict FEU tagging (default: True)
+            index_cache: Optional JSON file remembering each vault file's
+                VaultID and checksum by (mtime, size), so unchanged files are
+                not re-hashed, and files without a VaultID are not re-read
         """
         self.vault_path = vault_path
         self.strict_mode = strict_mode
+        self.index_cache = Path(index_cache) if index_cache else None
         self.vault_index: Dict[str, Any] = {}
+        # _verify_against_vault answers, keyed by searched text
+        self._vault_hits: Dict[str, bool] = {}
+        # Vault file contents, read on first query rather than while indexing
+        # and then kept, since vault-wide searches visit every file
+        self._vault_texts: Dict[str, Optional[str]] = {}
+        # Lowercased UTF-8 copies, made only for files searched by VaultID
+        self._vault_lowered: Dict[str, Optional[bytes]] = {}
 
         if vault_path:
             self._index_vault()
@@ -77,26 +210,136 @@ class TruthStateEnforcer:
         if not self.vault_path or not self.vault_path.exists():
             return
 
+        cached = self._load_index_cache()
+        md_files = _iter_markdown_files(self.vault_path)
+
+        # Reading and hashing are I/O plus GIL-free hashlib work, so larger
+        # vaults overlap them on threads; map() keeps glob order, which decides
+        # the winner when two files declare the same VaultID
+        def scan(md_file: Path) -> Optional[Dict[str, Any]]:
+            return self._scan_vault_file(md_file, cached.get(str(md_file)))
+
+        if len(md_files) >= _PARALLEL_INDEX_MIN_FILES:
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4)) as pool:
+                scanned = list(pool.map(scan, md_files))
+        else:
+            scanned = map(scan, md_files)
+
+        seen: Dict[str, Dict[str, Any]] = {}
+
         # Index vault files for quick lookup
-        for md_file in self.vault_path.glob("**/*.md"):
-            try:
-                content = md_file.read_text(encoding='utf-8')
-                # Extract VaultID if present
-                vault_id_match = re.search(r'(?:vault_id|VaultID):\s*(\S+)', content)
-                if vault_id_match:
-                    vault_id = vault_id_match.group(1)
-                    self.vault_index[vault_id] = {
-                        'path': md_file,
-                        'content': content,
-                        'checksum': self._compute_file_checksum(md_file)
-                    }
-            except Exception:
+        for md_file, entry in zip(md_files, scanned):
+            if entry is None:
                 continue
+            seen[str(md_file)] = entry
+
+            vault_id = entry.get('vault_id')
+            if vault_id:
+                # Content is left on disk until a query needs it (_vault_content)
+                self.vault_index[vault_id] = {
+                    'path': md_file,
+                    'size': entry.get('size'),
+                    'checksum': entry.get('checksum')
+                }
+
+        self._store_index_cache(seen)
+
+    def _scan_vault_file(
+        self,
+        md_file: Path,
+        entry: Any
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Read one vault file for the index.
+
+        Args:
+            md_file: Markdown file to scan
+            entry: Its index cache entry from a previous run, if any
+
+        Returns:
+            Cache entry (mtime, size, VaultID, checksum), or None if the file
+            cannot be read or decoded; an unchanged cached entry is reused
+            without reading the file
+        """
+        try:
+            st = md_file.stat()
+            if not (isinstance(entry, dict)
+                    and entry.get('mtime_ns') == st.st_mtime_ns
+                    and entry.get('size') == st.st_size):
+                # Read once: the raw bytes are hashed, the decoded text is searched
+                data = md_file.read_bytes()
+                content = _decode_text(data)
+                # Extract VaultID if present
+                vault_id_match = _VAULT_ID_RE.search(content)
+                entry = {
+                    'mtime_ns': st.st_mtime_ns,
+                    'size': st.st_size,
+                    'vault_id': vault_id_match.group(1) if vault_id_match else None,
+                    'checksum': hashlib.sha256(data).hexdigest() if vault_id_match else None
+                }
+            return entry
+        except Exception:
+            return None
+
+    def _vault_content(self, vault_id: str) -> Optional[str]:
+        """
+        Content of an indexed vault file, read from disk on first use.
+
+        Returns:
+            File content, or None if the VaultID is not indexed or its file
+            can no longer be read
+        """
+        try:
+            return self._vault_texts[vault_id]
+        except KeyError:
+            pass
+
+        content = None
+        entry = self.vault_index.get(vault_id)
+        if entry is not None:
+            try:
+                content = _decode_text(entry['path'].read_bytes())
+            except (OSError, UnicodeDecodeError):
+                pass
+
+        self._vault_texts[vault_id] = content
+        return content
+
+    def _vault_file_mentions(self, vault_id: str, statement: str) -> bool:
+        """Case-insensitively check whether a vault file contains the statement."""
+        try:
+            lowered = self._vault_lowered[vault_id]
+        except KeyError:
+            content = self._vault_content(vault_id)
+            lowered = self._vault_lowered[vault_id] = (
+                _lower_utf8(content) if content is not None else None
+            )
+        return lowered is not None and _lower_utf8(statement) in lowered
+
+    def _load_index_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load per-file index entries from the index cache, if enabled."""
+        if self.index_cache is None:
+            return {}
 
-    def _compute_file_checksum(self, file_path: Path) -> str:
-        """Compute SHA-256 checksum of file."""
-        content = file_path.read_text(encoding='utf-8')
-        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+        try:
+            cached = json.loads(self.index_cache.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+
+        return cached if isinstance(cached, dict) else {}
+
+    def _store_index_cache(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Write the index cache atomically; only files seen this run are kept."""
+        if self.index_cache is None:
+            return
+
+        try:
+            self.index_cache.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_cache.with_suffix(f'.{os.getpid()}.tmp')
+            tmp_path.write_text(json.dumps(entries), encoding='utf-8')
+            os.replace(tmp_path, self.index_cache)
+        except OSError as e:
+            print(f"Warning: could not write index cache {self.index_cache}: {e}")
 
     def classify_statement(
         self,
@@ -117,8 +360,7 @@ class TruthStateEnforcer:
         """
         # Check if verifiable in vault
         if vault_id and vault_id in self.vault_index:
-            vault_entry = self.vault_index[vault_id]
-            if statement.lower() in vault_entry['content'].lower():
+            if self._vault_file_mentions(vault_id, statement):
                 return TruthState.FACT
 
         # Check if has valid citation
@@ -133,13 +375,7 @@ class TruthStateEnforcer:
                 return TruthState.FACT
 
         # Check for uncertainty markers in statement
-        uncertainty_markers = [
-            'might', 'maybe', 'possibly', 'probably', 'likely',
-            'appears', 'seems', 'could be', 'may be', 'should be'
-        ]
-
-        statement_lower = statement.lower()
-        if any(marker in statement_lower for marker in uncertainty_markers):
+        if _has_uncertainty_marker(statement.lower()):
             return TruthState.ESTIMATE
 
         # If vault is available but no verification found
@@ -199,11 +435,10 @@ class TruthStateEnforcer:
         if truth_state == TruthState.FACT:
             return statement  # Facts don't need tagging
 
-        tag = f"[{truth_state.value}]"
         if context:
-            tag = f"[{truth_state.value} — {context}]"
+            return f"[{truth_state.value} — {context}] {statement}"
 
-        return f"{tag} {statement}"
+        return _FEU_TAG_PREFIXES[truth_state] + statement
 
     def detect_hallucination(
         self,
@@ -220,20 +455,16 @@ class TruthStateEnforcer:
         Returns:
             Tuple of (is_hallucination, reason)
         """
-        hallucination_patterns = [
-            (r'(?:VaultID|vault_id):\s*AMOS://[^\s]+', 'fabricated_vault_id'),
-            (r'⟡⟦[A-Z]+⟧', 'fabricated_glyph'),
-            (r'Checksum:\s*[0-9a-fA-F]{64}', 'fabricated_checksum'),
-            (r'Predecessor:\s*AMOS://', 'fabricated_lineage'),
-        ]
-
-        for pattern, reason in hallucination_patterns:
-            matches = re.findall(pattern, statement)
-            if matches:
-                # Verify each match against vault
-                for match in matches:
-                    if not self._verify_against_vault(match):
-                        return True, f"Potential hallucination: {reason} - '{match}'"
+        # Every pattern needs one of these literals; most statements have none,
+        # so the regex pass is skipped for them
+        if any(token in statement for token in _HALLUCINATION_TOKENS):
+            for pattern, reason in _HALLUCINATION_PATTERNS:
+                matches = pattern.findall(statement)
+                if matches:
+                    # Verify each match against vault
+                    for match in matches:
+                        if not self._verify_against_vault(match):
+                            return True, f"Potential hallucination: {reason} - '{match}'"
 
         # Check claimed source
         if claimed_source and not self._verify_source(claimed_source):
@@ -246,12 +477,20 @@ class TruthStateEnforcer:
         if not self.vault_path:
             return False
 
-        # Search vault for content
-        for entry in self.vault_index.values():
-            if content in entry['content']:
-                return True
-
-        return False
+        # The same citation tends to recur across statements; the index is
+        # fixed once built, so each distinct text is searched for only once
+        hit = self._vault_hits.get(content)
+        if hit is None:
+            # Search vault for content
+            hit = False
+            for vault_id in self.vault_index:
+                text = self._vault_content(vault_id)
+                if text is not None and content in text:
+                    hit = True
+                    break
+            self._vault_hits[content] = hit
+
+        return hit
 
     def detect_drift(
         self,
@@ -269,16 +508,19 @@ class TruthStateEnforcer:
             Tuple of (drift_level, drift_reasons)
         """
         drift_reasons = []
-
-        # Check critical drift indicators
-        critical_keys = ['vault_id', 'session_id', 'master_citation_version']
-        for key in critical_keys:
-            if key in previous_state and key in current_state:
-                if previous_state[key] != current_state[key]:
+        has_critical = False
+
+        # Check critical drift indicators (only keys present in both states)
+        shared = previous_state.keys() & _CRITICAL_DRIFT_KEYS & current_state.keys()
+        for key in _CRITICAL_DRIFT_KEYS:
+            if key in shared:
+                previous, current = previous_state[key], current_state[key]
+                if previous != current:
                     drift_reasons.append(
                         f"Critical drift: {key} changed from "
-                        f"'{previous_state[key]}' to '{current_state[key]}'"
+                        f"'{previous}' to '{current}'"
                     )
+                    has_critical = True
 
         # Check for lineage breaks
         if 'predecessor' in current_state and 'session_id' in previous_state:
@@ -295,7 +537,7 @@ class TruthStateEnforcer:
                 )
 
         # Determine drift level
-        if any('Critical' in reason for reason in drift_reasons):
+        if has_critical:
             return DriftLevel.CRITICAL, drift_reasons
         elif drift_reasons:
             return DriftLevel.WARNING, drift_reasons
@@ -332,8 +574,7 @@ class TruthStateEnforcer:
             )
 
         # Verify statement against vault content
-        vault_entry = self.vault_index[vault_id]
-        if statement.lower() in vault_entry['content'].lower():
+        if self._vault_file_mentions(vault_id, statement):
             return True, statement  # Valid, no tagging needed
 
         return False, self.tag_statement(
@@ -344,13 +585,16 @@ class TruthStateEnforcer:
 
     def generate_feu_report(
         self,
-        statements: List[Dict[str, Any]]
+        statements: List[Dict[str, Any]],
+        collect_details: bool = True
     ) -> Dict[str, Any]:
         """
         Generate FEU compliance report for a set of statements.
 
         Args:
             statements: List of statement dicts with 'text' and optional 'source'
+            collect_details: If False, only the counts and score are produced
+                and 'details' is left empty (default: True)
 
         Returns:
             FEU compliance report
@@ -364,34 +608,45 @@ class TruthStateEnforcer:
             'compliance_score': 0.0,
             'details': []
         }
+        details = report['details'] if collect_details else None
+        tally = dict.fromkeys(('facts', 'estimates', 'unknowns', 'hallucinations'), 0)
+
+        # Repeated (text, source) pairs are classified and checked once per report;
+        # the memo is local so vault or filesystem changes between reports are seen
+        verdicts: Dict[Tuple[str, Optional[str]], Tuple[TruthState, bool, Optional[str], str]] = {}
+
+        # Bound once: the loop below runs per statement
+        classify = self.classify_statement
+        detect_hallucination = self.detect_hallucination
+        lookup_verdict = verdicts.get
 
         for stmt_dict in statements:
             text = stmt_dict.get('text', '')
             source = stmt_dict.get('source')
 
-            # Classify
-            truth_state = self.classify_statement(text, source)
-
-            # Check for hallucination
-            is_hallucination, reason = self.detect_hallucination(text, source)
-
-            detail = {
-                'statement': text,
-                'truth_state': truth_state.value,
-                'hallucination': is_hallucination,
-                'reason': reason
-            }
-            report['details'].append(detail)
-
-            # Count
-            if is_hallucination:
-                report['hallucinations'] += 1
-            elif truth_state == TruthState.FACT:
-                report['facts'] += 1
-            elif truth_state == TruthState.ESTIMATE:
-                report['estimates'] += 1
-            else:
-                report['unknowns'] += 1
+            verdict = lookup_verdict((text, source))
+            if verdict is None:
+                # Classify
+                truth_state = classify(text, source)
+
+                # Check for hallucination
+                is_hallucination, reason = detect_hallucination(text, source)
+
+                # Count hallucinations ahead of their truth state
+                bucket = 'hallucinations' if is_hallucination else _TALLY_KEYS[truth_state]
+                verdict = verdicts[(text, source)] = (truth_state, is_hallucination, reason, bucket)
+            truth_state, is_hallucination, reason, bucket = verdict
+
+            tally[bucket] += 1
+            if details is not None:
+                details.append({
+                    'statement': text,
+                    'truth_state': truth_state.value,
+                    'hallucination': is_hallucination,
+                    'reason': reason
+                })
+
+        report.update(tally)
 
         # Calculate compliance score (higher is better)
         # Facts = 1.0, Estimates = 0.5, Unknowns = 0.3, Hallucinations = -1.0
@@ -420,16 +675,14 @@ def enforce_feu_on_text(text: str, vault_path: Optional[Path] = None) -> str:
     """
     enforcer = TruthStateEnforcer(vault_path=vault_path)
 
-    # Simple sentence splitting (can be enhanced)
-    sentences = re.split(r'(?<=[.!?])\s+', text)
-
-    tagged_sentences = []
-    for sentence in sentences:
-        truth_state = enforcer.classify_statement(sentence)
-        tagged = enforcer.tag_statement(sentence, truth_state)
-        tagged_sentences.append(tagged)
+    classify = enforcer.classify_statement
+    tag = enforcer.tag_statement
 
-    return ' '.join(tagged_sentences)
+    # Simple sentence splitting (can be enhanced)
+    return ' '.join(
+        tag(sentence, classify(sentence))
+        for sentence in _SENTENCE_SPLIT_RE.split(text)
+    )
 
 
 if __name__ == "__main__":
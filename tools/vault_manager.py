@@ -29,17 +29,98 @@ The vault is the source of truth, not ephemeral context.
 All continuity flows through the vault.
 """
 
+import functools
 import hashlib
 import json
+import mmap
+import os
 import re
+import sys
+import time
 import unicodedata
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
 from dataclasses import dataclass, asdict
 
+# Python 3.10+: slotted dataclasses, without a per-instance __dict__ (one
+# LineageChain is kept per registered artifact)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# AMOS://domain/resource.../version: domain is up to the first '/' after the
+# scheme, version after the last '/', resource everything in between
+_VAULT_ID_PARTS_RE = re.compile(r'AMOS://([^/]*)/(.*)/([^/]*)', re.DOTALL)
+
+# Read size for streaming raw file checksums when hashlib.file_digest is unavailable
+_HASH_CHUNK_SIZE = 64 * 1024
+
+# Files this large are hashed/decoded straight from a memory mapping
+_MMAP_MIN_SIZE = 1 << 20
+
+# What str.rstrip() strips within ASCII, minus the line separator '\n';
+# bytes.rstrip() alone leaves the \x1c-\x1f separators in place
+_ASCII_TRAILING_WS = b' \t\r\x0b\x0c\x1c\x1d\x1e\x1f'
+_ASCII_SEPARATORS = (b'\x1c', b'\x1d', b'\x1e', b'\x1f')
+
+# compute_checksum remembers canonical digests of this many recent contents,
+# each at most this many characters long
+_CANONICAL_MEMO_SIZE = 128
+_CANONICAL_MEMO_MAX_CHARS = 64 * 1024
+
+# Batches of at least this many files are checksummed on a thread pool
+_PARALLEL_HASH_MIN_FILES = 32
+
+# compute_vault_state_hash serializes this many manifest entries per hash update
+_STATE_HASH_BATCH = 512
+_STATE_ENCODER = json.JSONEncoder(sort_keys=True, ensure_ascii=False)
+
+
+@functools.lru_cache(maxsize=1)
+def _utc_second_iso(seconds: int) -> str:
+    """ISO 8601 text of a whole UTC second, without offset."""
+    return datetime.fromtimestamp(seconds, timezone.utc).replace(tzinfo=None).isoformat()
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time in the naive ``datetime.utcnow().isoformat()`` format.
+
+    Only the microseconds are formatted per call; the date-and-time part is
+    reused until the second changes.
+    """
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    micros = nanos // 1000
+    prefix = _utc_second_iso(seconds)
+    return f'{prefix}.{micros:06d}' if micros else prefix
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Replace ``path`` with ``data`` via a synced temp file and os.replace.
+
+    Readers (and a crash mid-save) see either the old file or the new one,
+    never a truncated mix.
+    """
+    tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def _json_file_bytes(obj: Any) -> bytes:
+    """Serialize a manifest or lineage graph as saved on disk (indent 2, UTF-8, final newline)."""
+    return (json.dumps(obj, indent=2, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class VaultID:
     """
     Represents a MirrorDNA VaultID following AMOS:// URI format.
@@ -60,13 +141,11 @@ class VaultID:
         if not vault_id_str.startswith('AMOS://'):
             raise ValueError(f"Invalid VaultID format: {vault_id_str}")
 
-        parts = vault_id_str[7:].split('/')
-        if len(parts) < 3:
+        match = _VAULT_ID_PARTS_RE.fullmatch(vault_id_str)
+        if match is None:
             raise ValueError(f"VaultID must have domain/resource/version: {vault_id_str}")
 
-        domain = parts[0]
-        version = parts[-1]
-        resource = '/'.join(parts[1:-1])
+        domain, resource, version = match.groups()
 
         return cls(domain=domain, resource=resource, version=version)
 
@@ -88,7 +167,7 @@ class VaultID:
         return cls(domain=domain, resource=resource, version=version)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class LineageChain:
     """
     Represents lineage relationship between vault artifacts.
@@ -128,20 +207,56 @@ class VaultManager:
     5. Manage vault manifests
     """
 
-    def __init__(self, vault_path: Path):
+    def __init__(self, vault_path: Path, checksum_cache: Optional[Path] = None):
         """
         Initialize Vault Manager.
 
         Args:
             vault_path: Path to vault root directory
+            checksum_cache: Optional JSON file remembering file checksums by
+                (resolved path, mtime, size), so unchanged artifacts are not
+                re-hashed by later registrations and verifications
         """
         self.vault_path = Path(vault_path)
         self.manifest_path = self.vault_path / "vault_manifest.json"
         self.lineage_path = self.vault_path / "lineage_graph.json"
+        self.checksum_cache_path = Path(checksum_cache) if checksum_cache else None
 
         # Load or initialize manifest
         self.manifest: Dict[str, Any] = self._load_manifest()
         self.lineage_graph: Dict[str, LineageChain] = self._load_lineage()
+        # Reverse of the predecessor links: VaultID -> every direct successor,
+        # including all branches of a fork (LineageChain.successor keeps one)
+        self._children: Dict[str, set] = {}
+        # Graph positions plus the report's root/leaf/fork sets, kept current by
+        # _record_artifact so generate_lineage_report does not rescan the graph
+        self._node_order: Dict[str, int] = {}
+        self._roots: set = set()
+        self._leaves: set = set()
+        self._forks: set = set()
+        # trace_lineage results by (VaultID, backward?); cleared on registration
+        self._chain_cache: Dict[Tuple[str, bool], Tuple[str, ...]] = {}
+        # detect_cycles result; None until computed and again after registration
+        self._cycles: Optional[List[List[str]]] = None
+        for position, (vault_id, lineage) in enumerate(self.lineage_graph.items()):
+            self._node_order[vault_id] = position
+            if lineage.predecessor:
+                self._children.setdefault(lineage.predecessor, set()).add(vault_id)
+            if lineage.is_root():
+                self._roots.add(vault_id)
+            if lineage.is_leaf():
+                self._leaves.add(vault_id)
+            if lineage.is_fork():
+                self._forks.add(vault_id)
+        self._checksum_cache: Optional[Dict[str, Any]] = self._load_checksum_cache()
+        self._checksum_cache_dirty = False
+        # In-memory registrations not yet written by flush()
+        self._dirty = False
+        # Re-checksumming the same text (e.g. verify right after register)
+        # skips canonicalization; keyed by the content string itself
+        self._memo_canonical_checksum = functools.lru_cache(maxsize=_CANONICAL_MEMO_SIZE)(
+            self._canonical_checksum
+        )
 
     def _load_manifest(self) -> Dict[str, Any]:
         """Load vault manifest or create default."""
@@ -151,7 +266,7 @@ class VaultManager:
         else:
             return {
                 'vault_version': '1.0',
-                'created_at': datetime.utcnow().isoformat(),
+                'created_at': _utc_now_iso(),
                 'artifacts': {},
                 'checksums': {},
                 'lineage_chains': {}
@@ -162,47 +277,121 @@ class VaultManager:
         if self.lineage_path.exists():
             with open(self.lineage_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-                return {
-                    k: LineageChain(**v) for k, v in data.items()
-                }
+                graph = {}
+                for k, v in data.items():
+                    chain = LineageChain(**v)
+                    # Interned like registered ids: traversals hash and compare them repeatedly
+                    chain.vault_id = sys.intern(chain.vault_id)
+                    if chain.predecessor:
+                        chain.predecessor = sys.intern(chain.predecessor)
+                    if chain.successor:
+                        chain.successor = sys.intern(chain.successor)
+                    graph[sys.intern(k)] = chain
+                return graph
         else:
             return {}
 
+    def _load_checksum_cache(self) -> Optional[Dict[str, Any]]:
+        """Load the checksum cache, if enabled; an unreadable cache starts empty."""
+        if self.checksum_cache_path is None:
+            return None
+
+        try:
+            with open(self.checksum_cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        return cached if isinstance(cached, dict) else {}
+
+    def _save_checksum_cache(self) -> None:
+        """Write the checksum cache atomically if it gained entries."""
+        if self._checksum_cache is None or not self._checksum_cache_dirty:
+            return
+
+        try:
+            self.checksum_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.checksum_cache_path.with_suffix(f'.{os.getpid()}.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._checksum_cache, f)
+            os.replace(tmp_path, self.checksum_cache_path)
+            self._checksum_cache_dirty = False
+        except OSError as e:
+            print(f"Warning: could not write checksum cache {self.checksum_cache_path}: {e}")
+
     def _save_manifest(self) -> None:
         """Save manifest to disk."""
         self.vault_path.mkdir(parents=True, exist_ok=True)
-        with open(self.manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(self.manifest, f, indent=2, ensure_ascii=False)
-            f.write('\n')
+        # Serialized up front, then written with a single write()
+        _atomic_write_bytes(self.manifest_path, _json_file_bytes(self.manifest))
 
     def _save_lineage(self) -> None:
         """Save lineage graph to disk."""
         self.vault_path.mkdir(parents=True, exist_ok=True)
         data = {k: asdict(v) for k, v in self.lineage_graph.items()}
-        with open(self.lineage_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-            f.write('\n')
+        _atomic_write_bytes(self.lineage_path, _json_file_bytes(data))
+
+    def flush(self) -> None:
+        """Write the manifest, lineage graph and checksum cache if registrations are unsaved."""
+        if self._dirty:
+            self._save_manifest()
+            self._save_lineage()
+            self._dirty = False
+        self._save_checksum_cache()
 
     def compute_checksum(
         self,
-        content: str,
+        content: Union[str, bytes],
         canonicalize: bool = True
     ) -> str:
         """
         Compute SHA-256 checksum with optional canonicalization.
 
         Args:
-            content: Content to hash
+            content: Content to hash; bytes are taken as UTF-8 text and
+                give the same checksum as the decoded string
             canonicalize: Apply canonicalization (UTF-8, LF, NFC, trim)
 
         Returns:
             64-character hex digest
         """
+        if isinstance(content, bytes):
+            if not canonicalize:
+                return hashlib.sha256(content).hexdigest()
+            # ASCII bytes are canonicalized as bytes; anything else needs NFC on text
+            if not content.isascii():
+                content = content.decode('utf-8')
+
         if canonicalize:
-            content = self._canonicalize_content(content)
+            if len(content) <= _CANONICAL_MEMO_MAX_CHARS:
+                return self._memo_canonical_checksum(content)
+            return self._canonical_checksum(content)
+
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
 
+    def _canonical_checksum(self, content: Union[str, bytes]) -> str:
+        """SHA-256 of the canonicalized content (compute_checksum's default)."""
+        if isinstance(content, bytes):
+            return hashlib.sha256(self._canonicalize_ascii_bytes(content)).hexdigest()
+        content = self._canonicalize_content(content)
         return hashlib.sha256(content.encode('utf-8')).hexdigest()
 
+    def _canonicalize_ascii_bytes(self, data: bytes) -> bytes:
+        """
+        _canonicalize_content for pure-ASCII bytes, without a decode/encode
+        round trip (ASCII is already NFC, so only line endings and trailing
+        whitespace change).
+        """
+        if b'\r' in data:
+            data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+        # Plain rstrip() is faster; the explicit set is only needed when the
+        # \x1c-\x1f separators occur (memchr scans, cheaper than a regex)
+        strip_chars = None
+        if any(sep in data for sep in _ASCII_SEPARATORS):
+            strip_chars = _ASCII_TRAILING_WS
+        data = b'\n'.join([line.rstrip(strip_chars) for line in data.split(b'\n')])
+        return data.rstrip(b'\n') + b'\n'
+
     def _canonicalize_content(self, content: str) -> str:
         """
         Canonicalize content for consistent hashing.
@@ -213,34 +402,125 @@ class VaultManager:
         - NFC Unicode normalization
         - Trim trailing whitespace
         """
-        # Normalize to NFC
-        content = unicodedata.normalize('NFC', content)
+        # Normalize to NFC (ASCII text already is; isascii() is O(1) on str)
+        if not content.isascii():
+            content = unicodedata.normalize('NFC', content)
 
         # Convert to LF line endings
-        content = content.replace('\r\n', '\n').replace('\r', '\n')
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
 
-        # Trim trailing whitespace per line
-        lines = content.split('\n')
-        lines = [line.rstrip() for line in lines]
-        content = '\n'.join(lines)
+        # Trim trailing whitespace per line (map keeps the loop in C)
+        content = '\n'.join(map(str.rstrip, content.split('\n')))
 
         # Trim trailing newlines at end of file
         content = content.rstrip('\n') + '\n'
 
         return content
 
-    def compute_file_checksum(self, file_path: Path) -> str:
+    def compute_file_checksum(
+        self,
+        file_path: Path,
+        canonicalize: bool = True
+    ) -> str:
         """
         Compute checksum for a file.
 
         Args:
             file_path: Path to file
+            canonicalize: Hash the canonicalized text (default); if False,
+                hash the raw bytes without decoding the file
 
         Returns:
             SHA-256 checksum
         """
-        content = file_path.read_text(encoding='utf-8')
-        return self.compute_checksum(content)
+        if self._checksum_cache is None:
+            return self._hash_file(file_path, canonicalize)
+
+        # Reuse the digest while the file's (mtime, size) are unchanged
+        st = file_path.stat()
+        key = str(file_path.resolve())
+        mode = 'canonical' if canonicalize else 'raw'
+        entry = self._checksum_cache.get(key)
+        if not (isinstance(entry, dict)
+                and entry.get('mtime_ns') == st.st_mtime_ns
+                and entry.get('size') == st.st_size):
+            entry = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size}
+            self._checksum_cache[key] = entry
+
+        checksum = entry.get(mode)
+        if not isinstance(checksum, str):
+            checksum = self._hash_file(file_path, canonicalize)
+            entry[mode] = checksum
+            self._checksum_cache_dirty = True
+
+        return checksum
+
+    def compute_file_checksums(
+        self,
+        file_paths: List[Path],
+        canonicalize: bool = True
+    ) -> Dict[Path, str]:
+        """
+        Compute checksums for many files, on a thread pool for larger batches.
+
+        Args:
+            file_paths: Paths to files
+            canonicalize: As for compute_file_checksum
+
+        Returns:
+            Dict mapping each path to its SHA-256 checksum
+        """
+        file_paths = list(file_paths)
+        return dict(zip(file_paths, self._iter_file_checksums(file_paths, canonicalize)))
+
+    def _iter_file_checksums(
+        self,
+        file_paths: List[Path],
+        canonicalize: bool
+    ) -> Iterator[str]:
+        """Yield compute_file_checksum for each path, in order."""
+        if len(file_paths) < _PARALLEL_HASH_MIN_FILES:
+            for file_path in file_paths:
+                yield self.compute_file_checksum(file_path, canonicalize)
+            return
+
+        # Reads and hashlib digests release the GIL, so files overlap on threads;
+        # map() keeps input order and re-raises a failure at its own position
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4)) as pool:
+            yield from pool.map(
+                lambda file_path: self.compute_file_checksum(file_path, canonicalize),
+                file_paths
+            )
+
+    def _hash_file(self, file_path: Path, canonicalize: bool) -> str:
+        """Hash a file's canonicalized text or raw bytes (compute_file_checksum)."""
+        with open(file_path, 'rb') as f:
+            # Large files: hash or decode the page-cache mapping, with no
+            # intermediate bytes copy of the whole file
+            if os.fstat(f.fileno()).st_size >= _MMAP_MIN_SIZE:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if not canonicalize:
+                        return hashlib.sha256(mm).hexdigest()
+                    # Canonicalization converts CR/CRLF itself, so no newline
+                    # translation is needed while decoding
+                    return self.compute_checksum(str(mm, 'utf-8'))
+
+            if canonicalize:
+                return self.compute_checksum(f.read())
+
+            # Python 3.11+: C-level read loop feeding OpenSSL
+            if hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(f, 'sha256').hexdigest()
+            digest = hashlib.sha256()
+            buf = bytearray(_HASH_CHUNK_SIZE)
+            view = memoryview(buf)
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                digest.update(view[:n])
+            return digest.hexdigest()
 
     def verify_checksum(
         self,
@@ -266,7 +546,9 @@ class VaultManager:
         vault_id: str,
         file_path: Path,
         predecessor: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        canonicalize: bool = True,
+        autosave: bool = True
     ) -> str:
         """
         Register an artifact in the vault with checksum and lineage.
@@ -276,38 +558,118 @@ class VaultManager:
             file_path: Path to artifact file
             predecessor: VaultID of predecessor (for lineage)
             metadata: Optional metadata dict
+            canonicalize: Checksum the canonicalized text (default); if False,
+                checksum the raw bytes (recorded so verify_artifact does too)
+            autosave: Save to disk now (default); if False, the registration
+                stays in memory until flush() is called
 
         Returns:
             Computed checksum
         """
-        # Compute checksum
-        checksum = self.compute_file_checksum(file_path)
+        checksum = self.compute_file_checksum(file_path, canonicalize)
+        self._record_artifact(
+            vault_id, file_path, checksum, predecessor, metadata, canonicalize
+        )
+
+        # Save updates
+        if autosave:
+            self.flush()
+
+        return checksum
+
+    def register_artifacts(
+        self,
+        items: List[Tuple[str, Path, Optional[str], Optional[Dict[str, Any]]]],
+        canonicalize: bool = True
+    ) -> Dict[str, str]:
+        """
+        Register several artifacts, saving the manifest and lineage once.
+
+        Items are registered in order, so an item may name an earlier one as
+        its predecessor. If an item fails, the artifacts registered before it
+        are still saved.
+
+        Args:
+            items: (vault_id, file_path, predecessor, metadata) tuples
+            canonicalize: As for register_artifact, applied to every item
+
+        Returns:
+            Dict mapping each VaultID to its computed checksum
+        """
+        items = list(items)
+        checksums: Dict[str, str] = {}
+        try:
+            file_checksums = self._iter_file_checksums(
+                [file_path for _, file_path, _, _ in items], canonicalize
+            )
+            # A file that failed to hash raises here, at its own position
+            for (vault_id, file_path, predecessor, metadata), checksum in zip(items, file_checksums):
+                self._record_artifact(
+                    vault_id, file_path, checksum, predecessor, metadata, canonicalize
+                )
+                checksums[vault_id] = checksum
+        finally:
+            # One rewrite of each file for the whole batch, not one per artifact
+            self.flush()
+
+        return checksums
+
+    def _record_artifact(
+        self,
+        vault_id: str,
+        file_path: Path,
+        checksum: str,
+        predecessor: Optional[str],
+        metadata: Optional[Dict[str, Any]],
+        canonicalize: bool
+    ) -> None:
+        """Add a checksummed artifact to the in-memory manifest and lineage graph (no save)."""
+        self._dirty = True
+        # Interned so every index below shares one key object per VaultID
+        vault_id = sys.intern(vault_id)
+        if predecessor:
+            predecessor = sys.intern(predecessor)
 
         # Register in manifest
         self.manifest['artifacts'][vault_id] = {
             'file_path': str(file_path),
-            'registered_at': datetime.utcnow().isoformat(),
+            'registered_at': _utc_now_iso(),
             'metadata': metadata or {}
         }
+        if not canonicalize:
+            self.manifest['artifacts'][vault_id]['canonicalize'] = False
 
         self.manifest['checksums'][vault_id] = checksum
 
         # Register lineage
+        previous = self.lineage_graph.get(vault_id)
+        if previous is not None and previous.predecessor:
+            self._children.get(previous.predecessor, set()).discard(vault_id)
+        if predecessor:
+            self._children.setdefault(predecessor, set()).add(vault_id)
+
         lineage = LineageChain(
             vault_id=vault_id,
             predecessor=predecessor
         )
         self.lineage_graph[vault_id] = lineage
 
+        self._chain_cache.clear()
+        self._cycles = None
+
+        # A new chain is a leaf and no fork; a root only without a predecessor
+        self._node_order.setdefault(vault_id, len(self._node_order))
+        if predecessor is None:
+            self._roots.add(vault_id)
+        else:
+            self._roots.discard(vault_id)
+        self._leaves.add(vault_id)
+        self._forks.discard(vault_id)
+
         # Update predecessor's successor if it exists
         if predecessor and predecessor in self.lineage_graph:
             self.lineage_graph[predecessor].successor = vault_id
-
-        # Save updates
-        self._save_manifest()
-        self._save_lineage()
-
-        return checksum
+            self._leaves.discard(predecessor)
 
     def verify_artifact(self, vault_id: str) -> Tuple[bool, List[str]]:
         """
@@ -340,7 +702,10 @@ class VaultManager:
             issues.append("No checksum recorded for artifact")
             return False, issues
 
-        actual_checksum = self.compute_file_checksum(file_path)
+        actual_checksum = self.compute_file_checksum(
+            file_path, artifact.get('canonicalize', True)
+        )
+        self._save_checksum_cache()
         if actual_checksum != expected_checksum:
             issues.append(
                 f"Checksum mismatch: expected {expected_checksum}, "
@@ -368,32 +733,125 @@ class VaultManager:
         if vault_id not in self.lineage_graph:
             return []
 
+        backward = direction == 'backward'
+        cached = self._chain_cache.get((vault_id, backward))
+        if cached is not None:
+            return list(cached)
+
         chain = [vault_id]
         current = vault_id
+        # A lineage cycle ends the chain before its first repeated artifact
+        seen = {vault_id}
+        cyclic = False
 
-        if direction == 'backward':
+        if backward:
             # Trace to root
             while True:
                 lineage = self.lineage_graph[current]
                 if lineage.predecessor is None:
                     break
-                chain.append(lineage.predecessor)
                 current = lineage.predecessor
+                if current in seen:
+                    cyclic = True
+                    break
                 if current not in self.lineage_graph:
+                    chain.append(current)
+                    break
+                # The rest of the chain is already known from an earlier trace
+                rest = self._chain_cache.get((current, backward))
+                if rest is not None:
+                    chain.extend(rest)
                     break
+                chain.append(current)
+                seen.add(current)
         else:
             # Trace to leaf
             while True:
                 lineage = self.lineage_graph[current]
                 if lineage.successor is None:
                     break
-                chain.append(lineage.successor)
                 current = lineage.successor
+                if current in seen:
+                    cyclic = True
+                    break
                 if current not in self.lineage_graph:
+                    chain.append(current)
                     break
+                rest = self._chain_cache.get((current, backward))
+                if rest is not None:
+                    chain.extend(rest)
+                    break
+                chain.append(current)
+                seen.add(current)
 
+        # Only cycle-free chains are cached, so splicing one never repeats an artifact
+        if not cyclic:
+            self._chain_cache[(vault_id, backward)] = tuple(chain)
         return chain
 
+    def get_successors(self, vault_id: str) -> List[str]:
+        """
+        List every artifact registered with this VaultID as its predecessor.
+
+        Unlike LineageChain.successor, which holds only the latest one, this
+        includes each branch of a fork.
+
+        Args:
+            vault_id: VaultID to look up
+
+        Returns:
+            Sorted list of successor VaultIDs
+        """
+        return sorted(self._children.get(vault_id, ()))
+
+    def detect_cycles(self) -> List[List[str]]:
+        """
+        Find lineage cycles (artifacts that are, transitively, their own predecessor).
+
+        Each artifact has at most one predecessor, so every walk back along
+        predecessors either ends (at a root, a missing predecessor, or an
+        already-explored chain) or enters exactly one cycle. The walks are
+        iterative, with each artifact colored unvisited / on the current walk /
+        done, so every artifact is visited once and long chains are fine.
+
+        Returns:
+            One list per cycle, predecessor before successor, starting from the
+            first of its artifacts reached in lineage graph order
+        """
+        if self._cycles is None:
+            self._cycles = self._find_cycles()
+        return [list(cycle) for cycle in self._cycles]
+
+    def _find_cycles(self) -> List[List[str]]:
+        """Walk the lineage graph for detect_cycles (uncached)."""
+        graph = self.lineage_graph
+        on_walk, done = 1, 2
+        color: Dict[str, int] = {}
+        cycles = []
+
+        for start in graph:
+            if start in color:
+                continue
+
+            walk = []
+            current = start
+            while current in graph and current not in color:
+                color[current] = on_walk
+                walk.append(current)
+                current = graph[current].predecessor
+
+            # Back at an artifact of this same walk: it and everything after it
+            # on the walk form a cycle
+            if color.get(current) == on_walk:
+                cycle = walk[walk.index(current):]
+                cycle.reverse()
+                cycles.append(cycle[-1:] + cycle[:-1])
+
+            for vault_id in walk:
+                color[vault_id] = done
+
+        return cycles
+
     def validate_lineage_chain(self, vault_id: str) -> Tuple[bool, List[str]]:
         """
         Validate complete lineage chain for a VaultID.
@@ -439,23 +897,18 @@ class VaultManager:
         Returns:
             Lineage report dict
         """
+        in_graph_order = self._node_order.__getitem__
+
+        # Special nodes come from the sets maintained on load/registration,
+        # listed in lineage graph order
         report = {
             'total_artifacts': len(self.lineage_graph),
-            'root_nodes': [],
-            'leaf_nodes': [],
-            'fork_points': [],
+            'root_nodes': sorted(self._roots, key=in_graph_order),
+            'leaf_nodes': sorted(self._leaves, key=in_graph_order),
+            'fork_points': sorted(self._forks, key=in_graph_order),
             'chains': {}
         }
 
-        # Identify special nodes
-        for vault_id, lineage in self.lineage_graph.items():
-            if lineage.is_root():
-                report['root_nodes'].append(vault_id)
-            if lineage.is_leaf():
-                report['leaf_nodes'].append(vault_id)
-            if lineage.is_fork():
-                report['fork_points'].append(vault_id)
-
         # Trace chains from each root
         for root in report['root_nodes']:
             chain = self.trace_lineage(root, 'forward')
@@ -475,7 +928,7 @@ class VaultManager:
             'lineage_graph': {
                 k: asdict(v) for k, v in self.lineage_graph.items()
             },
-            'exported_at': datetime.utcnow().isoformat(),
+            'exported_at': _utc_now_iso(),
             'vault_checksum': self.compute_vault_state_hash()
         }
 
@@ -486,12 +939,26 @@ class VaultManager:
         Returns:
             SHA-256 hash of vault state
         """
-        state = {
-            'artifacts': sorted(self.manifest['artifacts'].items()),
-            'checksums': sorted(self.manifest['checksums'].items())
-        }
-        state_json = json.dumps(state, sort_keys=True, ensure_ascii=False)
-        return hashlib.sha256(state_json.encode('utf-8')).hexdigest()
+        # Feeds the hash the exact bytes of
+        #   json.dumps({'artifacts': sorted(artifacts.items()),
+        #               'checksums': sorted(checksums.items())},
+        #              sort_keys=True, ensure_ascii=False)
+        # a batch of entries at a time, never holding the whole document
+        digest = hashlib.sha256()
+        for prefix, section in (
+            ('{"artifacts": [', self.manifest['artifacts']),
+            ('], "checksums": [', self.manifest['checksums'])
+        ):
+            digest.update(prefix.encode('utf-8'))
+            pairs = sorted(section.items())
+            for start in range(0, len(pairs), _STATE_HASH_BATCH):
+                # Encode a list of pairs and drop its brackets to get the items
+                chunk = _STATE_ENCODER.encode(pairs[start:start + _STATE_HASH_BATCH])[1:-1]
+                if start:
+                    chunk = ', ' + chunk
+                digest.update(chunk.encode('utf-8'))
+        digest.update(b']}')
+        return digest.hexdigest()
 
 
 def generate_vault_id(
@@ -514,19 +981,23 @@ def generate_vault_id(
 
 
 if __name__ == "__main__":
-    import sys
     import argparse
 
     parser = argparse.ArgumentParser(description="MirrorDNA Vault Manager")
     parser.add_argument('--vault', required=True, help='Path to vault')
+    parser.add_argument('--checksum-cache', action='store_true',
+                        help='Skip re-hashing unchanged artifacts using '
+                             '<vault>/checksum_cache.json')
 
     subparsers = parser.add_subparsers(dest='command', help='Commands')
 
     # Register command
     register_parser = subparsers.add_parser('register', help='Register artifact')
-    register_parser.add_argument('--vault-id', required=True, help='VaultID')
-    register_parser.add_argument('--file', required=True, help='File path')
+    register_parser.add_argument('--vault-id', help='VaultID')
+    register_parser.add_argument('--file', help='File path')
     register_parser.add_argument('--predecessor', help='Predecessor VaultID')
+    register_parser.add_argument('--batch', help='File with one artifact per line: '
+                                 'VaultID<TAB>file path[<TAB>predecessor VaultID]')
 
     # Verify command
     verify_parser = subparsers.add_parser('verify', help='Verify artifact')
@@ -547,16 +1018,41 @@ if __name__ == "__main__":
         parser.print_help()
         sys.exit(1)
 
-    manager = VaultManager(Path(args.vault))
+    vault_path = Path(args.vault)
+    manager = VaultManager(
+        vault_path,
+        checksum_cache=vault_path / "checksum_cache.json" if args.checksum_cache else None
+    )
 
     if args.command == 'register':
-        checksum = manager.register_artifact(
-            vault_id=args.vault_id,
-            file_path=Path(args.file),
-            predecessor=args.predecessor
-        )
-        print(f"✓ Registered {args.vault_id}")
-        print(f"  Checksum: {checksum}")
+        if args.batch:
+            items = []
+            with open(args.batch, 'r', encoding='utf-8') as f:
+                for line_no, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    fields = line.rstrip('\n').split('\t')
+                    if len(fields) not in (2, 3):
+                        register_parser.error(
+                            f"{args.batch}:{line_no}: expected VaultID<TAB>file"
+                            f"[<TAB>predecessor], got {len(fields)} field(s)"
+                        )
+                    predecessor = fields[2] if len(fields) == 3 and fields[2] else None
+                    items.append((fields[0], Path(fields[1]), predecessor, None))
+            checksums = manager.register_artifacts(items)
+            for vault_id, checksum in checksums.items():
+                print(f"✓ Registered {vault_id}")
+                print(f"  Checksum: {checksum}")
+        elif args.vault_id and args.file:
+            checksum = manager.register_artifact(
+                vault_id=args.vault_id,
+                file_path=Path(args.file),
+                predecessor=args.predecessor
+            )
+            print(f"✓ Registered {args.vault_id}")
+            print(f"  Checksum: {checksum}")
+        else:
+            register_parser.error("--vault-id and --file are required without --batch")
 
     elif args.command == 'verify':
         is_valid, issues = manager.verify_artifact(args.vault_id)
@@ -3,8 +3,8 @@ import sys, re, json
 
 def load_front_matter(text: str):
     # Extract YAML-like front matter between leading --- blocks
-    start = text.find('---')
-    if start != 0:
+    # (anchored prefix check: no scan of the whole body when the opener is missing)
+    if not text.startswith('---'):
         raise ValueError("Front matter must start with '---' at the first line")
     end = text.find('\n---', 3)
     if end == -1: